@@ -22,17 +22,43 @@
 
 import os
 import tempfile
+import threading
 import time
 
 # python 3.4+
 from pathlib import Path
 
-from RizomUVLinkBase import CRizomUVLinkBase
-from RizomUVLinkBase import CZEx
+try:
+    # the same commands, their help text left on disk until asked for (see RizomUVLinkGen)
+    from RizomUVLinkBaseCompact import CRizomUVLinkBase
+    from RizomUVLinkBaseCompact import CZEx
+except ImportError:
+    from RizomUVLinkBase import CRizomUVLinkBase
+    from RizomUVLinkBase import CZEx
+from RizomUVLinkArrays import ArraysFromResult
+from RizomUVLinkArrays import BufferView
+from RizomUVLinkArrays import IsBuffer
+from RizomUVLinkArrays import ToArray
+from RizomUVLinkArrays import MarshalParameters
+from RizomUVLinkCache import CReadCache
+from RizomUVLinkMetrics import CLinkMetrics
+from RizomUVLinkMetrics import CSpanTracer
+from RizomUVLinkMetrics import NO_SPAN
+from RizomUVLinkMetrics import ParameterSummary
+from RizomUVLinkMetrics import PayloadBytes
+from RizomUVLinkNotify import CNotificationCoalescer
+from RizomUVLinkNotify import CNotificationDispatcher
+from RizomUVLinkSchema import CParameterValidator
+from RizomUVLinkSchema import LoadSchemas
+from RizomUVLinkSharedMemory import HANDLE_KEY
+from RizomUVLinkSharedMemory import ReadSegment
+from RizomUVLinkSharedMemory import ReleaseSegment
+from RizomUVLinkSharedMemory import SplitBlocks
+from RizomUVLinkSharedMemory import WriteSegment
 
 
 class CLaunchLock:
-    """Exclusive right to start a RizomUV on one TCP port.
+    """Exclusive right to start a RizomUV on one TCP port, or on count consecutive ones.
 
     The link protocol is single client per port: while a command runs the standalone
     answers heart beats and swallows the client's reply with a raw receive, which only
@@ -42,56 +68,855 @@ class CLaunchLock:
 
     So a launch is serialised on a lock file named after the port. The lock is held by
     the OS, not by its content, and is released when the holder dies: a crashed launcher
-    leaves nothing to clean up.
+    leaves nothing to clean up but its file, which the next Release() of that port
+    removes. Ports are drawn at random (see FreeTCPPort), so files that outlived their
+    launch would otherwise pile up in the temporary directory.
     """
 
-    def __init__(self, port : int):
-        self.path = os.path.join(tempfile.gettempdir(), "rizomuvlink_launch_%d.lock" % port)
-        self.handle = None
+    def __init__(self, port : int, count : int = 1):
+        self.paths = [os.path.join(tempfile.gettempdir(), "rizomuvlink_launch_%d.lock" % p)
+                      for p in range(port, port + count)]
+        self.handles = []
 
-    def Acquire(self) -> bool:
-        """ True when this process may launch. False means someone else is launching
-            on that port right now, and the only sane thing to do is wait for it. """
-        try:
-            self.handle = open(self.path, "a+b")
-        except OSError:
-            return False  # no lock possible here: behave as before rather than refuse to work
+    @staticmethod
+    def _TryLock(handle) -> bool:
         try:
-            self.handle.seek(0)
+            handle.seek(0)
             if os.name == "nt":
                 import msvcrt
-                msvcrt.locking(self.handle.fileno(), msvcrt.LK_NBLCK, 1)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
             else:
                 import fcntl
-                fcntl.flock(self.handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
             return True
         except OSError:
-            self.handle.close()
-            self.handle = None
             return False
 
-    def Release(self):
-        if self.handle is None:
-            return
+    @staticmethod
+    def _Unlock(handle):
         try:
-            self.handle.seek(0)
+            handle.seek(0)
             if os.name == "nt":
+                # closing releases the lock too, but only "eventually": another
+                # process could still fail to take it right after Release()
                 import msvcrt
-                msvcrt.locking(self.handle.fileno(), msvcrt.LK_UNLCK, 1)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
             else:
                 import fcntl
-                fcntl.flock(self.handle.fileno(), fcntl.LOCK_UN)
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
         except OSError:
             pass
-        self.handle.close()
-        self.handle = None
+
+    @staticmethod
+    def _Lock(path : str):
+        """ The open, locked file at path, or None when it is locked already. """
+        try:
+            handle = open(path, "a+b")
+        except OSError:
+            return None
+        if not CLaunchLock._TryLock(handle):
+            handle.close()
+            return None
+        if os.name != "nt":
+            # the previous holder removes the file on release: a lock won on the
+            # file it just removed is a lock on nothing, and another launcher may
+            # hold the one now at that path
+            try:
+                current, locked = os.stat(path), os.fstat(handle.fileno())
+                replaced = (current.st_dev, current.st_ino) != (locked.st_dev, locked.st_ino)
+            except OSError:
+                replaced = True
+            if replaced:
+                CLaunchLock._Unlock(handle)
+                handle.close()
+                return None
+        return handle
+
+    def Acquire(self) -> bool:
+        """ True when this process may launch. False means someone else is launching
+            on that port right now, and the only sane thing to do is wait for it.
+            With several ports, they are all locked or none is. """
+        for path in self.paths:
+            handle = self._Lock(path)
+            if handle is None:
+                self.Release()
+                return False
+            self.handles.append((path, handle))
+        return True
+
+    def Held(self) -> bool:
+        """ True when someone holds the lock of one of the ports. Checked without
+            creating nor removing anything: there is no lock without a file, and
+            a file found is only locked for as long as the check takes. """
+        for path in self.paths:
+            try:
+                handle = open(path, "r+b")
+            except OSError:
+                continue
+            with handle:
+                if not self._TryLock(handle):
+                    return True
+                self._Unlock(handle)
+        return False
+
+    def Release(self):
+        for path, handle in self.handles:
+            if os.name == "nt":
+                # a file someone else has open cannot be removed, and is left for them
+                self._Unlock(handle)
+                handle.close()
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+                continue
+            # removed while still locked: whoever opened it meanwhile sees it is no
+            # longer the file at that path once it gets the lock (see _Lock)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self._Unlock(handle)
+            handle.close()
+        self.handles = []
+
+class CTimeoutPolicy:
+    """How long a command may take before the link gives up on it, in ms.
+
+    One fixed timeout cannot suit both a Get, which answers in microseconds, and a
+    Pack on a production mesh, which may legitimately run for minutes. The timeout
+    of a command is therefore built from:
+
+      - a per command default (commands), the default otherwise,
+      - plus msPerMillionElements for each million elements the parameters carry
+        (a Load of Data.* vectors),
+      - plus msPerMillionPolygons for each million polygons of the loaded mesh for
+        the commands that process the whole mesh (meshCommands), and for the
+        reads (meshReads) of a path under meshPaths, whose reply may be a whole
+        mesh vector (Get("Lib.Mesh.UVW")),
+      - raised to learnFactor times the latency observed so far for that command,
+        so that a scene which is slow for that machine does not time out on the
+        very next call,
+      - capped at maximum.
+
+    Everything is a plain attribute, meant to be read and changed. Override(ms)
+    imposes a timeout on the commands sent from within a with block, on the
+    calling thread only, and Execute() takes one per call.
+
+    Liveness is not left to the timeout: the compiled module answers the
+    instance's heart beats itself, and a launched instance that died is caught
+    from its process handle before anything is sent (see CRizomUVLink.Execute).
+    Short defaults stay safe for that reason.
+    """
+
+    def __init__(self, default : int = 2000, maximum : int = 3600000):
+        self.default = default
+        self.maximum = maximum
+        self.commands = {
+            "Get": 2000, "GetVersion": 2000, "Count": 2000, "ItemNames": 2000, "Set": 2000,
+            "Load": 30000, "Save": 30000,
+            "Unfold": 60000, "Optimize": 60000, "Pack": 120000, "Hotspot": 120000,
+            "IslandGroups": 30000, "RasterExport": 60000,
+        }
+        self.meshCommands = {"Load", "Save", "Unfold", "Optimize", "Pack", "Hotspot",
+                             "Cut", "Weld", "Select", "IslandGroups", "RasterExport"}
+        self.meshReads = {"Get"}
+        self.meshPaths = ("Lib.Mesh",)
+        self.msPerMillionElements = 5000
+        self.msPerMillionPolygons = 20000
+        self.learnFactor = 4.0
+        self.learnWeight = 0.2
+        self.polygonCount = 0   # of the loaded mesh, kept up to date by the link
+        self.observed = {}      # command name -> moving average of its latency, ms
+        self.local = threading.local()
+
+    def TimeOut(self, commandName : str, elementCount : int = 0, path : str = None) -> int:
+        """ path: the data tree path a read command is given, if any. """
+        forced = getattr(self.local, "forced", None)
+        if forced:
+            return forced[-1]
+        ms = self.commands.get(commandName, self.default)
+        ms += self.msPerMillionElements * elementCount / 1e6
+        if commandName in self.meshCommands or (commandName in self.meshReads and path is not None
+                                                and any(path == p or path.startswith(p + ".") for p in self.meshPaths)):
+            ms += self.msPerMillionPolygons * self.polygonCount / 1e6
+        observed = self.observed.get(commandName)
+        if observed is not None:
+            ms = max(ms, self.learnFactor * observed)
+        return int(min(ms, self.maximum))
+
+    def Observe(self, commandName : str, ms : float):
+        """ Record how long a successful command took. """
+        observed = self.observed.get(commandName)
+        if observed is None:
+            self.observed[commandName] = ms
+        else:
+            self.observed[commandName] = observed + self.learnWeight * (ms - observed)
+
+    def Override(self, ms : int):
+        """ with policy.Override(600000): link.Pack(...) """
+        policy = self
+
+        class _Override:
+            def __enter__(self):
+                if not hasattr(policy.local, "forced"):
+                    policy.local.forced = []
+                policy.local.forced.append(int(ms))
+
+            def __exit__(self, *exc):
+                policy.local.forced.pop()
+
+        return _Override()
+
+    def Describe(self) -> dict:
+        """ The current state of the policy, for logs and for inspection. """
+        return {"default": self.default, "maximum": self.maximum,
+                "commands": dict(self.commands),
+                "msPerMillionElements": self.msPerMillionElements,
+                "msPerMillionPolygons": self.msPerMillionPolygons,
+                "polygonCount": self.polygonCount,
+                "learnFactor": self.learnFactor,
+                "observed": dict(self.observed)}
+
+
+def CommandNames(base) -> frozenset:
+    """ The names of the commands generated in base: COMMANDS of a compact base,
+        the methods taking (self, params) of a full one, where the hand written
+        methods (Execute, Connect...) all take something else. """
+    import sys
+    commands = getattr(sys.modules[base.__module__], "COMMANDS", None)
+    if commands is not None:
+        return frozenset(commands)
+    import inspect
+    return frozenset(name for name, value in vars(base).items()
+                     if inspect.isfunction(value) and list(inspect.signature(value).parameters) == ["self", "params"])
+
+
+COMMAND_NAMES = CommandNames(CRizomUVLinkBase)
+
+
+def CommandDoc(function, commandName : str):
+    """ function, documented as the generated command commandName. The help text
+        of a compact base stays on disk until asked for. """
+    command = CRizomUVLinkBase.__dict__[commandName]
+    if hasattr(command, "Wrap"):
+        return command.Wrap(function)
+    function.__doc__ = command.__doc__
+    return function
+
+
+def ElementCount(parameters) -> int:
+    """ How many vector elements a command carries, walking nested tables. """
+    if isinstance(parameters, dict):
+        return sum(ElementCount(v) for v in parameters.values())
+    if isinstance(parameters, (list, tuple)):
+        return len(parameters)
+    return 0
+
+class CBatchResult:
+    """ The result of one command of a CCommandBatch, known once it ran. """
+
+    def __init__(self, commandName : str):
+        self.commandName = commandName
+        self.done = False
+        self.value = None
+        self.error = None
+
+    def Value(self):
+        if self.error is not None:
+            raise CZEx(self.commandName + " failed: " + self.error)
+        if not self.done:
+            raise CZEx(self.commandName + " has not run: the batch was not submitted, "
+                       "or stopped on an earlier command")
+        return self.value
+
+
+class CCommandBatch:
+    """ Commands queued to be sent in a single request.
+
+        Each command otherwise pays a full round trip, heart beats included. Call
+        the commands on the batch as on the link; each call returns a CBatchResult
+        instead of running. Submit() -- or leaving the with block without an
+        exception -- sends them all as one "Batch" command:
+
+            {"Commands": [[<command name>, <parameters>], ...]}
+
+        answered with {"Results": [...], "Failed": <index or -1>, "Error": "..."}.
+        The instance runs the commands in order and stops at the first failure,
+        which Submit() then raises as a CZEx; the results of the commands that ran
+        before it are set.
+
+        An instance without batch support (see SupportsBatch) gets the same
+        commands one by one, with the same stop-at-first-failure behaviour.
+    """
+
+    def __init__(self, link):
+        self.link = link
+        self.commands = []
+        self.results = []
+
+    def Add(self, commandName : str, parameters = {}) -> CBatchResult:
+        if self.link.validator is not None:
+            # checked now, so that a mistake fails where it was made
+            self.link.validator.Validate(commandName, parameters)
+        # marshalled now: the batch is one table the parameters are nested in
+        self.commands.append([commandName, MarshalParameters(parameters)])
+        result = CBatchResult(commandName)
+        self.results.append(result)
+        return result
+
+    def __getattr__(self, name):
+        # the commands only: Execute, Connect... are methods of the link, which
+        # would fail or misbehave once sent as commands
+        if name not in COMMAND_NAMES:
+            raise AttributeError(name)
+
+        def add(params = {}):
+            return self.Add(name, params)
+        return add
+
+    def Submit(self) -> list:
+        """ Run the queued commands and return their results, in order. """
+        commands, results = self.commands, self.results
+        self.commands, self.results = [], []
+        if not commands:
+            return []
+        try:
+            return self.Run(commands, results)
+        finally:
+            # the queued Set commands went past link.Set(): drop what they touch,
+            # whether they all ran or not
+            cache = self.link.readCache
+            if cache is not None:
+                for name, params in commands:
+                    if name == "Set" and isinstance(params, dict) and "Path" in params:
+                        cache.Invalidate(params["Path"])
+
+    def Run(self, commands : list, results : list) -> list:
+        if self.link.SupportsBatch():
+            timeOut = sum(self.link.timeOutPolicy.TimeOut(name, ElementCount(params), params if isinstance(params, str) else None)
+                          for name, params in commands)
+            reply = self.link.Execute("Batch", {"Commands": commands}, timeOut = min(timeOut, self.link.timeOutPolicy.maximum))
+            for result, value in zip(results, reply["Results"]):
+                result.value = value
+                result.done = True
+            failed = reply.get("Failed", -1)
+            if failed >= 0:
+                results[failed].error = reply.get("Error", "")
+                results[failed].Value()
+        else:
+            for result, (name, params) in zip(results, commands):
+                try:
+                    result.value = self.link.Execute(name, params)
+                except CZEx as ex:
+                    result.error = str(ex)
+                    raise
+                result.done = True
+        return [result.value for result in results]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        if excType is None:
+            self.Submit()
 
 class CRizomUVLink(CRizomUVLinkBase):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, rizomuv = None):
+        """ rizomuv: what commands are sent through, the compiled module's
+            RizomUVLinkPyd by default. Any object with the same methods will do,
+            such as the stand-in's CRizomUVStandInPyd, which needs no compiled
+            module: CRizomUVLink(rizomuv = CRizomUVStandInPyd()) runs on any
+            platform. """
+        if rizomuv is None:
+            super().__init__()
+        else:
+            self.rizomuv = rizomuv
+            self.version = rizomuv.VersionString()
         self.port = None
+        self.process = None       # the instance RunRizomUV launched, if any
+        self.linkFeatures = {}    # what the connected instance supports, see SupportsLinkFeature()
+        self.timeOutPolicy = CTimeoutPolicy()
+        # one command at a time on the socket, whichever thread sends it: the
+        # listeners and prefetchers send commands from their own threads
+        self.commandLock = threading.RLock()
+        self.metrics = CLinkMetrics()
+        self.hooks = ()           # (before, after, error) triples, see AddHook()
+        self.tracer = None        # see EnableTracing()
+        self.validator = None     # see EnableValidation()
+        self.readCache = None     # see EnableReadCache()
+        self.stopCacheListener = None
+
+    def Execute(self, commandName, parameters, timeOut : int = None):
+        """ Send one command to the connected instance and return its result.
+
+            Any vector parameter (Data.CoordsXYZ, Data.PolyXYZIDs, IDs...) may be
+            given as a contiguous NumPy array, array.array or memoryview of int32,
+            int64, float32 or float64 instead of a list, for convenience: the
+            compiled module takes sequences only, so it is still converted to a
+            list before being sent (see MarshalParameters). An (n, 3) coordinates
+            array is taken as the flat list it lays out.
+
+            timeOut, in ms, defaults to what self.timeOutPolicy says for that
+            command (see CTimeoutPolicy).
+
+            Every command is accounted for in self.metrics (see Metrics()), is
+            reported to the hooks added with AddHook(), and is a span of the tracer
+            when tracing is enabled. With EnableValidation(), its parameters are
+            checked against the command's schema before anything is sent.
+        """
+        if self.validator is not None:
+            self.validator.Validate(commandName, parameters)
+        if self.process is not None and self.process.poll() is not None:
+            # nothing would ever answer: fail now rather than after a timeout
+            raise CZEx("The RizomUV instance on port " + str(self.port) + " exited with code "
+                       + str(self.process.returncode))
+        parameters = MarshalParameters(parameters)
+        if timeOut is None:
+            timeOut = self.timeOutPolicy.TimeOut(commandName, ElementCount(parameters),
+                                                 parameters if isinstance(parameters, str) else None)
+        hooks = self.hooks
+        summary = ParameterSummary(parameters) if hooks else None
+        for before, after, error in hooks:
+            if before is not None:
+                before(commandName, summary)
+        with self.Span(commandName, timeOut = timeOut):
+            with self.commandLock:
+                start = time.perf_counter()
+                try:
+                    result = self.rizomuv.Execute(commandName, parameters, timeOut)
+                    failure = None
+                except CZEx as ex:
+                    failure = ex
+                ms = (time.perf_counter() - start) * 1000.0
+            if failure is not None:
+                self.metrics.Record(commandName, ms, PayloadBytes(parameters), failed = True, timeOut = timeOut)
+                for before, after, error in hooks:
+                    if error is not None:
+                        error(commandName, summary, ms, failure)
+                raise failure
+        self.metrics.Record(commandName, ms, PayloadBytes(parameters), PayloadBytes(result))
+        for before, after, error in hooks:
+            if after is not None:
+                after(commandName, summary, ms)
+        self.timeOutPolicy.Observe(commandName, ms)
+        if commandName == "Load" and isinstance(parameters, dict):
+            sizes = parameters.get("Data.PolySizes")
+            if sizes is not None:
+                self.timeOutPolicy.polygonCount = len(sizes)
+            elif parameters.get("DefaultEmptyScene"):
+                self.timeOutPolicy.polygonCount = 0
+        return result
+
+    def RizomUVVersion(self):
+        """ Returns the version of the connected RizomUV standalone program. Sent
+            through Execute(), so that it is timed, traced and accounted for like
+            any other command: it is RunRizomUV's first round trip. """
+        return self.Execute("Get", "Vars.Infos.Version.Full", timeOut = 10000)
+
+    def Metrics(self) -> dict:
+        """ Per command name: call count, latency histogram, estimated request and
+            response sizes, timeouts and CZEx errors since the link was created
+            (or self.metrics.Reset()). See CLinkMetrics. """
+        return self.metrics.Snapshot()
+
+    def MetricsPrometheus(self) -> str:
+        """ Metrics() in the Prometheus text exposition format. """
+        return self.metrics.PrometheusText()
+
+    def AddHook(self, before = None, after = None, error = None):
+        """ Have callbacks called around every command sent by this link:
+
+                before(commandName, summary)         before it is sent
+                after(commandName, summary, ms)      once it succeeded
+                error(commandName, summary, ms, ex)  once it failed with the CZEx ex
+
+            summary is the command's parameters with every vector longer than 8
+            replaced by "<type of length>" (see ParameterSummary), cheap to log.
+            ms is the time spent waiting for the reply. The callbacks run on the
+            thread sending the command, outside the command lock; an exception
+            raised by one propagates to the caller, so that before may veto a
+            command. Any of the three may be omitted.
+
+            Returns a handle for RemoveHook().
+        """
+        hook = (before, after, error)
+        self.hooks = self.hooks + (hook,)
+        return hook
+
+    def RemoveHook(self, hook):
+        self.hooks = tuple(h for h in self.hooks if h is not hook)
+
+    def EnableTracing(self, onSpanEnd = None, maxSpans : int = 10000) -> CSpanTracer:
+        """ OPTIONAL: time every command, and the steps of the composite helpers
+            (RunRizomUV: Spawn, WaitForPort, FirstRoundTrip), as nested spans.
+
+                tracer = link.EnableTracing()
+                link.RunRizomUV()
+                print(tracer.Report())
+
+            The commands a helper sends are spans of the step sending them, and
+            Span() opens spans of one's own around a pipeline stage. See
+            CSpanTracer for onSpanEnd and maxSpans. Returns the tracer.
+        """
+        self.tracer = CSpanTracer(onSpanEnd, maxSpans)
+        return self.tracer
+
+    def DisableTracing(self):
+        self.tracer = None
+
+    def Span(self, name : str, **attributes):
+        """ A with block timed as a span of the tracer, doing nothing when tracing
+            is not enabled. """
+        if self.tracer is None:
+            return NO_SPAN
+        return self.tracer.Span(name, **attributes)
+
+    def EnableValidation(self) -> CParameterValidator:
+        """ OPTIONAL: check parameters before sending them.
 
-    def RunRizomUV(self, exePath : str = None, port : int = None, connect : bool = True, wait : bool = True, timeOut : float = 120.0, background : bool = False) -> int:
+            Each command's parameters are checked against the PARAMETER blocks of
+            its help text: unknown names (with the closest known one suggested),
+            values of the wrong type, strings outside the possible values. A
+            mistake raises a CZEx at once, before a round trip that might already
+            have changed the scene. Vectors are only checked to be vectors, so the
+            check costs microseconds whatever the mesh size. Commands whose help
+            text documents no parameter are not checked.
+
+            The help text does not always list every parameter a RizomUV version
+            accepts: should a valid call be refused, DisableValidation().
+        """
+        self.validator = CParameterValidator(LoadSchemas(CRizomUVLinkBase), extraKeys = (HANDLE_KEY,))
+        return self.validator
+
+    def DisableValidation(self):
+        self.validator = None
+
+    def SaveArrays(self, params = None, useNumpy : bool = None) -> dict:
+        """ Save() returning typed buffers instead of lists.
+
+            Same parameters as Save(), {"Data": True} by default. Every numeric
+            output (Data.CoordsUVW, Data.PolyUVWIDs, Data.PolySizes,
+            Data.SelectedVertIDs, IndexTable.*) comes back as a NumPy array when
+            NumPy is available, as an array.array otherwise: float64 coordinates and
+            int32 indices, ready for the host's own arrays without a list ever
+            reaching it. useNumpy=False forces array.array, True requires NumPy.
+        """
+        if params is None:
+            params = {"Data": True}
+        return ArraysFromResult(self.Save(params), useNumpy)
+
+    def Connect(self, port : int):
+        super().Connect(port)
+        self.linkFeatures = {}
+
+    def SupportsLinkFeature(self, name : str) -> bool:
+        """ True when the connected instance reports the link feature name under
+            Vars.Infos.Link. An instance that does not know the path does not have
+            the feature. Asked once per connection. """
+        if name not in self.linkFeatures:
+            try:
+                self.linkFeatures[name] = bool(self.Get("Vars.Infos.Link." + name))
+            except CZEx:
+                self.linkFeatures[name] = False
+        return self.linkFeatures[name]
+
+    def SupportsSharedMemory(self) -> bool:
+        """ True when the connected instance takes mesh vectors through a shared
+            memory segment (see RizomUVLinkSharedMemory). """
+        return self.SupportsLinkFeature(HANDLE_KEY)
+
+    def SupportsBatch(self) -> bool:
+        """ True when the connected instance runs a whole CCommandBatch in one
+            request (see Batch). """
+        return self.SupportsLinkFeature("Batch")
+
+    def Batch(self) -> "CCommandBatch":
+        """ Queue commands and send them in one round trip:
+
+                with link.Batch() as batch:
+                    batch.Select({...})
+                    batch.Cut({})
+                    unfold = batch.Unfold({})
+                    uvs = batch.Save({"Data": True})
+                print(uvs.Value())
+
+            See CCommandBatch.
+        """
+        return CCommandBatch(self)
+
+    def LoadShared(self, params : dict):
+        """ Load() passing the Data.* vectors through a shared memory segment.
+
+            Only the segment handle and its layout go through the socket; the
+            instance maps the segment and reads the vectors where the client wrote
+            them. Same parameters as Load(), buffers or lists alike. Falls back to a
+            plain Load() on an instance without shared memory support.
+        """
+        if not self.SupportsSharedMemory():
+            return self.Load(params)
+        blocks, remaining = SplitBlocks(params)
+        if not blocks:
+            return self.Load(params)
+        handle = WriteSegment(blocks)
+        try:
+            remaining[HANDLE_KEY] = handle
+            # the socket only sees the segment layout: the timeout and the mesh
+            # size are those of the vectors it holds
+            lengths = {key: len(BufferView(value)) if IsBuffer(value) else len(value) for key, value in blocks.items()}
+            result = self.Execute("Load", remaining, timeOut = self.timeOutPolicy.TimeOut("Load", sum(lengths.values())))
+        finally:
+            ReleaseSegment(handle)
+        if "Data.PolySizes" in lengths:
+            self.timeOutPolicy.polygonCount = lengths["Data.PolySizes"]
+        return result
+
+    def SaveShared(self, params = None, useNumpy : bool = None) -> dict:
+        """ SaveArrays() receiving the vectors through a shared memory segment the
+            instance writes and hands back. Returns the same {"Data": {...}} table
+            of typed buffers. Falls back to SaveArrays() on an instance without
+            shared memory support.
+        """
+        if params is None:
+            params = {"Data": True}
+        if not self.SupportsSharedMemory():
+            return self.SaveArrays(params, useNumpy)
+        result = self.Save(dict(params, **{HANDLE_KEY: True}))
+        handle = result.pop(HANDLE_KEY)
+        try:
+            blocks = ReadSegment(handle, useNumpy)
+        finally:
+            ReleaseSegment(handle)
+        for key, value in blocks.items():
+            table, name = key.split(".", 1)
+            result.setdefault(table, {})[name] = value
+        return result
+
+    def StartNotificationListener(self, port, callback, poll_ms = 200, quietMs : float = 0,
+                                  maxLatencyMs : float = None, maxPending : int = 0,
+                                  overflow : str = "dropOldest", workers : int = 0, onError = None):
+        """ OPTIONAL: receive push notifications without polling GetVersion yourself.
+
+            Call Subscribe({"Paths": [...]}) first; it returns the notification 'port'.
+            Pass that port here with a callback(path, version) that fires whenever one
+            of the subscribed data-tree paths changes. Returns a stop() function.
+
+            With quietMs > 0 the notifications are coalesced instead of debounced by
+            hand: a path is delivered once it stayed quiet for quietMs, or after at
+            most maxLatencyMs, with the latest version received for it. A long Pack
+            then fires the callback once rather than once per intermediate version,
+            and a slow callback never faces a backlog: what arrives while it runs is
+            merged. maxPending and overflow bound the paths waiting. See
+            CNotificationCoalescer.
+
+            With workers > 0 callbacks run on that many worker threads instead of the
+            listener's, callbacks of one path staying in order, and their errors are
+            counted and passed to onError(path, version, exception) rather than
+            silently dropped. stop.dispatcher.Stats() then reports error counts and
+            notification to callback latencies. See CNotificationDispatcher.
+
+            The listener waits on the channel for up to poll_ms at a time and wakes
+            up as soon as a notification arrives: poll_ms only bounds how long stop()
+            takes, not how late a notification is seen.
+        """
+        coalesce = quietMs > 0 or maxLatencyMs is not None or maxPending
+        if not coalesce and workers <= 0:
+            return super().StartNotificationListener(port, callback, poll_ms)
+
+        dispatcher = None
+        if workers > 0:
+            dispatcher = CNotificationDispatcher(callback, workers, onError)
+            deliver = dispatcher.Submit
+        else:
+            def deliver(path, version):
+                try:
+                    callback(path, version)
+                except Exception:
+                    pass
+
+        coalescer = None
+        sink = deliver
+        if coalesce:
+            coalescer = CNotificationCoalescer(deliver, quietMs, maxLatencyMs, maxPending, overflow)
+            sink = coalescer.Add
+
+        self.rizomuv.NotifyConnect(port)
+        stopEvent = threading.Event()
+
+        def read():
+            while not stopEvent.is_set():
+                msg = self.rizomuv.NotifyPoll(poll_ms)  # [] or [path, version]
+                if msg:
+                    sink(msg[0], msg[1] if len(msg) > 1 else "")
+
+        thread = threading.Thread(target = read, daemon = True)
+        thread.start()
+
+        def stop():
+            stopEvent.set()
+            thread.join(timeout = 2.0)
+            if coalescer is not None:
+                coalescer.Stop()
+            if dispatcher is not None:
+                dispatcher.Stop()
+        stop.coalescer = coalescer
+        stop.dispatcher = dispatcher
+        return stop
+
+    def PrefetchData(self, path : str):
+        """ What StartPrefetchListener fetches by default when path changed: the
+            Data outputs of Save for the UVs, the island index tables for the
+            islands, the value at path otherwise -- typed buffers for every
+            numeric list. """
+        if path.startswith("Lib.Mesh.UVW"):
+            return self.SaveArrays({"Data": True})
+        if path.startswith("Lib.Mesh.Islands"):
+            return self.SaveArrays({"IndexTable.PolygonIDsToIslandIDs": True,
+                                    "IndexTable.VertexIDsToIslandIDs": True})
+        value = self.Get(path)
+        if isinstance(value, list) and value and isinstance(value[0], (int, float)) and not isinstance(value[0], bool):
+            return ToArray(value, isinstance(value[0], float))
+        return ArraysFromResult(value)
+
+    def StartPrefetchListener(self, callback, paths : list = ("Lib.Mesh.UVW",), fetch = None,
+                              quietMs : float = 0, maxLatencyMs : float = None,
+                              onError = None, poll_ms = 200):
+        """ OPTIONAL: be handed the changed data, not just told it changed.
+
+            Subscribes to paths, and on each change fetches the data on a
+            background thread, then calls callback(path, version, data) from it.
+            fetch(link, path) does the fetching, PrefetchData by default. A fetch
+            is skipped when a newer notification for the same path is already
+            waiting, and its result dropped when one arrived during the fetch: the
+            callback only ever gets current data, and nothing is fetched twice for
+            one state. quietMs and maxLatencyMs coalesce the notifications as in
+            StartNotificationListener. Errors of fetch or callback go to
+            onError(path, version, exception) when given.
+
+            Subscribe replaces any previous subscription. Returns a stop()
+            function.
+        """
+        if fetch is None:
+            fetch = CRizomUVLink.PrefetchData
+        coalescer = None
+
+        def deliver(path, version):
+            if coalescer.IsPending(path):
+                return  # a newer version is queued: fetch that one instead
+            try:
+                data = fetch(self, path)
+                if coalescer.IsPending(path):
+                    return  # went stale while being fetched
+                callback(path, version, data)
+            except Exception as ex:
+                if onError is not None:
+                    try:
+                        onError(path, version, ex)
+                    except Exception:
+                        pass
+
+        coalescer = CNotificationCoalescer(deliver, quietMs, maxLatencyMs)
+        port = self.Subscribe({"Paths": list(paths)})
+        stopListener = super().StartNotificationListener(port, coalescer.Add, poll_ms)
+
+        def stop():
+            stopListener()
+            coalescer.Stop()
+        stop.coalescer = coalescer
+        return stop
+
+    def EnableReadCache(self, maxBytes : int = 64 * 1024 * 1024, watch : list = None) -> CReadCache:
+        """ OPTIONAL: serve Get, ItemNames, Count and Eval from a cache.
+
+            Every entry is checked with a recursive GetVersion of what it read
+            before being served: a hit costs that one data-less round trip. With
+            watch, a list of data tree paths, those paths are subscribed to (this
+            replaces any previous Subscribe) and reads under them are served with
+            no round trip at all, entries being dropped as notifications come in.
+            See CReadCache. Set() drops the entries it touches either way.
+
+            Returns the cache, whose hits/misses counters can be watched.
+        """
+        self.DisableReadCache()
+        cache = CReadCache(maxBytes)
+        if watch:
+            cache.watched = tuple(watch)
+            port = self.Subscribe({"Paths": list(watch)})
+            self.stopCacheListener = self.StartNotificationListener(port, cache.Notified)
+        self.readCache = cache
+        return cache
+
+    def DisableReadCache(self):
+        if self.stopCacheListener is not None:
+            self.stopCacheListener()
+            self.stopCacheListener = None
+        self.readCache = None
+
+    def CachedRead(self, commandName : str, params):
+        if self.readCache is None or not isinstance(params, str):
+            return self.Execute(commandName, params)
+        return self.readCache.Read(self, commandName, params)
+
+    def Get(self, params = {}):
+        return self.CachedRead("Get", params)
+    Get = CommandDoc(Get, "Get")
+
+    def ItemNames(self, params = {}):
+        return self.CachedRead("ItemNames", params)
+    ItemNames = CommandDoc(ItemNames, "ItemNames")
+
+    def Count(self, params = {}):
+        return self.CachedRead("Count", params)
+    Count = CommandDoc(Count, "Count")
+
+    def Eval(self, params = {}):
+        return self.CachedRead("Eval", params)
+    Eval = CommandDoc(Eval, "Eval")
+
+    def Set(self, params = {}):
+        result = self.Execute("Set", params)
+        if self.readCache is not None and isinstance(params, dict) and "Path" in params:
+            self.readCache.Invalidate(params["Path"])
+        return result
+    Set = CommandDoc(Set, "Set")
+
+    def GetIter(self, path : str, chunk : int = 65536, recursive : bool = False):
+        """ Read a large data tree node piece by piece, as a generator.
+
+            Get() on a big subtree ("Lib", "Lib.Mesh.Islands" on a large scene...)
+            serializes all of it in one reply, which can exceed the link timeout and
+            is held in memory whole on both sides. GetIter() walks the node with
+            Count()/ItemNames() instead and reads one child per request:
+
+              - on a table, yields (childPath, value) for each child. recursive=True
+                descends into the children that are tables themselves, so that only
+                leaves are ever read, and yields (leafPath, value) for them.
+              - on a leaf holding a list, yields (offset, slice) pairs of at most
+                chunk elements. The link has no ranged read, so the list still
+                comes in one reply: slicing bounds what the consumer handles at a
+                time, not the request.
+              - on any other leaf, yields (path, value) once.
+
+            Values are not kept: memory stays bounded by the largest child read.
+            The reads bypass the read cache, which would keep them all.
+        """
+        if self.Execute("Count", path) == 0:
+            value = self.Execute("Get", path)
+            if isinstance(value, list):
+                for offset in range(0, len(value), chunk):
+                    yield offset, value[offset:offset + chunk]
+            else:
+                yield path, value
+            return
+
+        for name in self.Execute("ItemNames", path):
+            childPath = path + "." + str(name)
+            if recursive and self.Execute("Count", childPath) > 0:
+                yield from self.GetIter(childPath, chunk, recursive)
+            else:
+                yield childPath, self.Execute("Get", childPath)
+
+    def RunRizomUV(self, exePath : str = None, port : int = None, connect : bool = True, wait : bool = True, timeOut : float = 120.0, background : bool = False, standby = None) -> int:
         """ Runs RizomUV, connect to the instance and wait for it to be ready
 
             RizomUV standalone version must be 2025.0 or later.
@@ -118,73 +943,129 @@ class CRizomUVLink(CRizomUVLinkBase):
             answers a command line it cannot parse with a usage message box that nobody
             is there to dismiss, so it would never reach its port.
 
+            standby, a CRizomUVStandby (see RizomUVLinkPool), provides an instance
+            launched beforehand instead: this object takes it over and returns at
+            once, and the standby starts a replacement in the background. port,
+            exePath and background are then those of the standby.
+
             returns:
                 The TCP port number used by the RizomUV instance to communicate.
          """
-        if exePath is None:
-            exePath = self.RizomUVPath()
-        if exePath is None:
-            raise CZEx("RizomUV executable path not found. Re-installing RizomUV should fix this issue.")
-
-        # define the TCP port used for communication
-        if port == None:
-            # search a free TCP port on the dynamic range
-            for p in range(49152, 65534):
-                if not self.TCPPortIsOpen(p):
-                    self.port = p
-                    break
-                if p == 65533:
-                    raise CZEx("No available TCP Port found. This shouldn't be the case. Might worth to check your firewall settings just in case.")
-        else:
-            if self.TCPPortIsOpen(port):
-                raise CZEx("Port " + str(port) + " is already in use, please connect using another port")
-            self.port = port
-        
-        # Only one process may start an instance on a given port. Without this, two
-        # scripts run in quick succession both see a port nobody has opened YET and both
-        # launch: the loser's instance never gets the port, and the two clients end up
-        # sharing one socket, which the heart beat protocol cannot pair up (see
-        # CLaunchLock). Whoever does not get the lock waits for the port instead, which
-        # is what it wanted in the first place.
-        launcher = CLaunchLock(self.port)
-        weLaunch = launcher.Acquire()
-        instance = None
-        try:
-            if weLaunch:
-                # run RizomUV asynchronously. The executable directory is handed to the
-                # child as its working directory rather than chdir()ed into: this runs
-                # inside a host application whose current directory is not ours to change.
-                import subprocess
-                args = [exePath, "-id", str(self.port)]
-                if background:
-                    args.append("-bg")
-                instance = subprocess.Popen(args, cwd=os.path.dirname(exePath))
-
-            # wait for the instance to open its port BEFORE anything is sent to it. The
-            # lock is held throughout, so nobody else launches while this one is coming up.
-            if wait:
-                self.WaitForPort(self.port, timeOut, process = instance)
-            elif not weLaunch:
-                # nothing was started here and the caller does not want to wait: say so
-                # rather than let it believe an instance is on its way
-                raise CZEx("Another process is already starting RizomUV on port "
-                           + str(self.port) + ". Call with wait=True to wait for it.")
-        finally:
-            launcher.Release()
+        with self.Span("RunRizomUV", port = port, background = background):
+            if standby is not None:
+                with self.Span("Checkout"):
+                    self.Adopt(standby.Checkout(timeOut if wait else 0.0))
+                return self.port
+
+            if exePath is None:
+                exePath = self.RizomUVPath()
+            if exePath is None:
+                raise CZEx("RizomUV executable path not found. Re-installing RizomUV should fix this issue.")
+
+            # define the TCP port used for communication
+            if port == None:
+                # a port the OS says is free, already locked for this launch: no other
+                # launcher can pick it in the meantime (see FreeTCPPort)
+                self.port, launcher = self.FreeTCPPort()
+                weLaunch = True
+            else:
+                if self.TCPPortIsOpen(port):
+                    raise CZEx("Port " + str(port) + " is already in use, please connect using another port")
+                self.port = port
 
-        # connect the the instance
-        if connect:
-            self.Connect(self.port)
+                # Only one process may start an instance on a given port. Without this, two
+                # scripts run in quick succession both see a port nobody has opened YET and both
+                # launch: the loser's instance never gets the port, and the two clients end up
+                # sharing one socket, which the heart beat protocol cannot pair up (see
+                # CLaunchLock). Whoever does not get the lock waits for the port instead, which
+                # is what it wanted in the first place.
+                launcher = CLaunchLock(self.port)
+                weLaunch = launcher.Acquire()
+            instance = None
+            try:
+                if weLaunch:
+                    # run RizomUV asynchronously. The executable directory is handed to the
+                    # child as its working directory rather than chdir()ed into: this runs
+                    # inside a host application whose current directory is not ours to change.
+                    import subprocess
+                    args = [exePath, "-id", str(self.port)]
+                    if background:
+                        args.append("-bg")
+                    with self.Span("Spawn"):
+                        instance = subprocess.Popen(args, cwd=os.path.dirname(exePath))
 
-        ## wait for RizomUV initialisation to complete
-        if wait and connect:
-            # the port is open, but the startup sequence may still be running: this
-            # round trip is what makes RunRizomUV return on a usable instance
-            version = self.RizomUVVersion()
+                # wait for the instance to open its port BEFORE anything is sent to it. The
+                # lock is held throughout, so nobody else launches while this one is coming up.
+                if wait:
+                    with self.Span("WaitForPort"):
+                        self.WaitForPort(self.port, timeOut, process = instance)
+                elif not weLaunch:
+                    # nothing was started here and the caller does not want to wait: say so
+                    # rather than let it believe an instance is on its way
+                    raise CZEx("Another process is already starting RizomUV on port "
+                               + str(self.port) + ". Call with wait=True to wait for it.")
+            finally:
+                launcher.Release()
 
-        return self.port
+            # watched by Execute(), which then fails at once should the instance die.
+            # None when another process launched it: we have no handle on that one.
+            self.process = instance
 
-    def WaitForPort(self, port : int, timeOut : float = 120.0, period : float = 0.25, process = None):
+            # connect the the instance
+            if connect:
+                self.Connect(self.port)
+
+            ## wait for RizomUV initialisation to complete
+            if wait and connect:
+                # the port is open, but the startup sequence may still be running: this
+                # round trip is what makes RunRizomUV return on a usable instance
+                with self.Span("FirstRoundTrip"):
+                    version = self.RizomUVVersion()
+
+            return self.port
+
+    def Adopt(self, other : "CRizomUVLink"):
+        """ Take over the instance other is connected to, connection included:
+            other is left without one. There is still a single client on the port,
+            the connection having changed hands rather than being opened twice. """
+        self.rizomuv, other.rizomuv = other.rizomuv, None
+        self.port, other.port = other.port, None
+        self.process, other.process = other.process, None
+        self.linkFeatures = other.linkFeatures
+        self.timeOutPolicy.polygonCount = other.timeOutPolicy.polygonCount
+
+    def FreeTCPPort(self, attempts : int = 32):
+        """ Pick a port for a new instance and lock it: returns (port, CLaunchLock)
+            with the lock acquired, for the caller to release once the instance
+            listens.
+
+            The OS is asked for a free ephemeral port (a bind on port 0), which
+            takes constant time however many ports are in use, where scanning the
+            dynamic range one probe at a time slowed down with each busy port.
+            Two launchers the OS handed the same port are told apart by the launch
+            lock: the one that does not get it draws another port. The following
+            port, the instance's notification channel, must be free as well, and is
+            locked along with it; and a port whose previous one is being launched on
+            is the notification channel of that launch, not free for all it is not
+            listening yet.
+        """
+        import socket
+        for attempt in range(attempts):
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+                probe.bind(("127.0.0.1", 0))
+                port = probe.getsockname()[1]
+            if port >= 65535 or self.TCPPortIsOpen(port + 1):
+                continue
+            if CLaunchLock(port - 1).Held():
+                continue
+            launcher = CLaunchLock(port, 2)
+            if launcher.Acquire():
+                if not self.TCPPortIsOpen(port):
+                    return port, launcher
+                launcher.Release()
+        raise CZEx("No available TCP Port found. This shouldn't be the case. Might worth to check your firewall settings just in case.")
+
+    def WaitForPort(self, port : int, timeOut : float = 120.0, period : float = 0.25, process = None, firstPeriod : float = 0.002):
         """ Block until a RizomUV instance listens on the given TCP port.
 
             Raises CZEx when timeOut seconds have passed. Polling the port leaves
@@ -192,23 +1073,52 @@ class CRizomUVLink(CRizomUVLinkBase):
             an instance that is not listening yet leaves an undeliverable request in
             the socket.
 
+            The port is probed after firstPeriod seconds, then at doubling intervals
+            up to period: an instance that is quick to come up is seen within a few
+            milliseconds, a slow one costs no more probes than before.
+
             process, when given, is the instance being waited for. It is watched
             alongside the port, so that one which refuses to start -- a command line it
             could not parse, an unavailable license -- is reported the moment it exits,
             naming its exit code, instead of being waited on for the whole timeOut.
+            Between probes the wait is on the process itself where the OS allows it
+            (a pidfd on Linux, the process handle on Windows), so its exit ends the
+            wait at once rather than at the next probe.
         """
         deadline = time.time() + timeOut
-        while not self.TCPPortIsOpen(port):
-            if process is not None and process.poll() is not None:
-                raise CZEx("RizomUV exited with code " + str(process.returncode)
-                           + " without opening the TCP port " + str(port)
-                           + ". It refused to start: most often a command line option "
-                           "this version does not know, or no available license.")
-            if time.time() > deadline:
-                raise CZEx("RizomUV did not open the TCP port " + str(port) + " within "
-                           + str(timeOut) + "s. Check that the instance actually started, "
-                           "and that no dialog box is waiting for an answer on it.")
-            time.sleep(period)
+        delay = min(firstPeriod, period)
+        pidfd = None
+        if process is not None and hasattr(os, "pidfd_open"):
+            try:
+                pidfd = os.pidfd_open(process.pid)
+            except OSError:
+                pidfd = None  # kernel older than 5.3: fall back to sleeping
+        try:
+            while not self.TCPPortIsOpen(port):
+                if process is not None and process.poll() is not None:
+                    raise CZEx("RizomUV exited with code " + str(process.returncode)
+                               + " without opening the TCP port " + str(port)
+                               + ". It refused to start: most often a command line option "
+                               "this version does not know, or no available license.")
+                if time.time() > deadline:
+                    raise CZEx("RizomUV did not open the TCP port " + str(port) + " within "
+                               + str(timeOut) + "s. Check that the instance actually started, "
+                               "and that no dialog box is waiting for an answer on it.")
+                if pidfd is not None:
+                    import select
+                    select.select([pidfd], [], [], delay)
+                elif process is not None and os.name == "nt":
+                    import subprocess
+                    try:
+                        process.wait(delay)
+                    except subprocess.TimeoutExpired:
+                        pass
+                else:
+                    time.sleep(delay)
+                delay = min(delay * 2, period)
+        finally:
+            if pidfd is not None:
+                os.close(pidfd)
 
 
     def RizomUVPath(self) -> str:
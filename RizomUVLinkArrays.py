@@ -0,0 +1,183 @@
+# MIT License
+#
+# Copyright (c) 2026 Rizom-Lab
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Typed buffers on the command channel.
+#
+# The link transfers ints and doubles. A host application usually holds its mesh
+# in NumPy arrays or array.array buffers: the helpers below take any buffer
+# protocol object as a parameter, so that the host need not convert them itself.
+# The compiled module takes sequences only, so a buffer is still turned into a
+# list (memoryview.tolist()) before it is sent, at the cost of doing it by hand.
+
+try:
+    # the compiled module's exception, taken from it directly: importing
+    # RizomUVLinkBase for it would compile all the generated help text
+    from win import rizomuvlink
+    CZEx = rizomuvlink.ZEx
+except ImportError:
+    # no compiled module for this platform: the helpers are still used there, by
+    # the stand-in server and by the tools working on buffers alone
+    class CZEx(Exception):
+        pass
+
+# memoryview formats the link knows how to transfer: native integers and floats.
+# Everything else (bools, complex, structured dtypes) has no meaning for a command.
+INT_FORMATS = "bBhHiIlLqQnN"
+FLOAT_FORMATS = "fd"
+
+
+def IsBuffer(value) -> bool:
+    """ True for the typed buffers a parameter may be given as: NumPy arrays,
+        array.array, memoryview, or anything else exposing the buffer protocol.
+        Strings and bytes are parameters in their own right, never vectors, and
+        NumPy scalars, 0-d buffers, are numbers (see IsScalarBuffer). """
+    if isinstance(value, (str, bytes, bytearray)):
+        return False
+    try:
+        return memoryview(value).ndim > 0
+    except TypeError:
+        return False
+
+
+def IsScalarBuffer(value) -> bool:
+    """ True for the 0-d buffers, NumPy scalars (numpy.int64(5), numpy.bool_)
+        mostly, which stand for a single number. """
+    if isinstance(value, (str, bytes, bytearray, int, float)):
+        return False
+    try:
+        return memoryview(value).ndim == 0
+    except TypeError:
+        return False
+
+
+def ScalarValue(value):
+    """ The Python number a 0-d buffer holds. """
+    if hasattr(value, "item"):
+        return value.item()
+    return memoryview(value).tolist()
+
+
+def BufferView(value) -> memoryview:
+    """ A flat, native memoryview over a typed buffer. Raises CZEx on a buffer the
+        link cannot transfer as it is, naming what to do about it rather than
+        silently copying. """
+    view = memoryview(value)
+    fmt = view.format
+    if len(fmt) == 2 and fmt[0] in "@=":
+        fmt = fmt[1:]
+    if len(fmt) != 1 or fmt not in INT_FORMATS + FLOAT_FORMATS:
+        raise CZEx("Unsupported buffer format '" + view.format + "': the link transfers "
+                   "native integers and floats only (int32, int64, float32, float64). "
+                   "Byte swapped or structured arrays must be converted first.")
+    if not view.c_contiguous:
+        raise CZEx("Non contiguous buffer: slice views and transposed arrays must be made "
+                   "contiguous first (numpy.ascontiguousarray).")
+    if view.ndim != 1 or view.format != fmt:
+        # an (n, 3) coordinate array is sent as the flat [x0 y0 z0 x1 ...] list the
+        # commands expect: same memory, no copy
+        view = view.cast("B").cast(fmt)
+    return view
+
+
+def MarshalParameters(parameters):
+    """ Return parameters ready for the compiled module: every typed buffer found as
+        a value, at any depth of nested tables, is replaced by the list of its
+        elements. The caller's dict is never modified.
+
+        Plain lists are passed through untouched and are not walked into, so that a
+        parameter already given as a list costs nothing here.
+    """
+    if isinstance(parameters, dict):
+        marshalled = None
+        for key, value in parameters.items():
+            if isinstance(value, dict):
+                converted = MarshalParameters(value)
+                if converted is value:
+                    continue
+            elif IsBuffer(value):
+                converted = BufferView(value).tolist()
+            elif IsScalarBuffer(value):
+                converted = ScalarValue(value)
+            else:
+                continue
+            if marshalled is None:
+                marshalled = dict(parameters)
+            marshalled[key] = converted
+        return parameters if marshalled is None else marshalled
+    if IsBuffer(parameters):
+        # Select({"IDs": ...}) is the usual case, but a command taking a bare vector
+        # is marshalled the same way
+        return BufferView(parameters).tolist()
+    if IsScalarBuffer(parameters):
+        return ScalarValue(parameters)
+    return parameters
+
+
+# Save() outputs holding doubles. Every other numeric output is an index list.
+DOUBLE_OUTPUTS = ("CoordsUVW", "CoordsXYZ", "UVWs")
+
+
+def ToArray(values : list, double : bool, useNumpy : bool = None):
+    """ Pack a list of numbers returned by a command into a typed buffer: a NumPy
+        array when NumPy is importable (or useNumpy is True), an array.array
+        otherwise. Doubles become float64, indices int32 -- or int64 should one of
+        them not fit. """
+    if useNumpy is None or useNumpy:
+        try:
+            import numpy
+        except ImportError:
+            if useNumpy:
+                raise CZEx("NumPy was asked for but is not installed in this Python")
+            numpy = None
+        if numpy is not None:
+            if double:
+                return numpy.array(values, dtype = numpy.float64)
+            try:
+                return numpy.array(values, dtype = numpy.int32)
+            except OverflowError:
+                return numpy.array(values, dtype = numpy.int64)
+
+    import array
+    if double:
+        return array.array("d", values)
+    try:
+        return array.array("i", values)
+    except OverflowError:
+        return array.array("q", values)
+
+
+def ArraysFromResult(result, useNumpy : bool = None):
+    """ Replace, in place, every numeric list of a command result table with its
+        typed buffer (see ToArray) and return the result. Each list is released as
+        soon as its buffer is built, so the peak holds one list at a time rather
+        than the whole boxed result next to its conversion. """
+    if not isinstance(result, dict):
+        return result
+    for key, value in result.items():
+        if isinstance(value, dict):
+            ArraysFromResult(value, useNumpy)
+        elif isinstance(value, list):
+            if value and (isinstance(value[0], bool) or not isinstance(value[0], (int, float))):
+                continue
+            double = key.rsplit(".", 1)[-1] in DOUBLE_OUTPUTS or (bool(value) and isinstance(value[0], float))
+            result[key] = ToArray(value, double, useNumpy)
+    return result
@@ -0,0 +1,107 @@
+# MIT License
+#
+# Copyright (c) 2026 Rizom-Lab
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import functools
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+from RizomUVLink import CRizomUVLink
+
+
+class CRizomUVLinkAsync:
+    """ asyncio counterpart of CRizomUVLink.
+
+        Every method of CRizomUVLink is available as a coroutine, with the same
+        parameters: await link.Load({...}), await link.Pack({}), await
+        link.RunRizomUV()...
+
+        The compiled module blocks while a command runs, so commands are run on a
+        worker thread of their own, one link per worker. That worker takes the
+        commands in the order they were awaited and runs them one at a time: the
+        link stays a single client on its port (see CLaunchLock), however many
+        coroutines use it at once. Several CRizomUVLinkAsync, each on its own
+        instance, run concurrently on one event loop.
+    """
+
+    def __init__(self, link : CRizomUVLink = None):
+        self.link = CRizomUVLink() if link is None else link
+        self.queue = ThreadPoolExecutor(max_workers = 1)
+
+    async def Call(self, method, *args, **kwargs):
+        """ Run a blocking method of self.link on the command worker. """
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.queue, functools.partial(method, *args, **kwargs))
+
+    def __getattr__(self, name):
+        if name in ("link", "queue"):
+            raise AttributeError(name)  # not constructed yet
+        attribute = getattr(self.link, name)
+        if not callable(attribute):
+            return attribute
+
+        async def command(*args, **kwargs):
+            return await self.Call(attribute, *args, **kwargs)
+        command.__name__ = name
+        command.__doc__ = attribute.__doc__
+        return command
+
+    async def Notifications(self, port : int, poll_ms : int = 200, maxQueued : int = 0):
+        """ Async iterator over change notifications:
+
+                port = await link.Subscribe({"Paths": ["Lib.Mesh.UVW"]})
+                async for path, version in link.Notifications(port):
+                    ...
+
+            The notification channel is read on a thread of its own, not on the
+            command worker, so commands keep flowing while it waits. maxQueued
+            bounds the notifications waiting for the loop (0: unbounded); past it
+            the oldest are dropped. Leaving the loop stops the reader.
+        """
+        loop = asyncio.get_event_loop()
+        queue = asyncio.Queue()
+        stop = threading.Event()
+
+        def push(message):
+            if maxQueued and queue.qsize() >= maxQueued:
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+        def read():
+            while not stop.is_set():
+                msg = self.link.NotifyPoll(poll_ms)  # [] or [path, version]
+                if msg:
+                    loop.call_soon_threadsafe(push, (msg[0], msg[1] if len(msg) > 1 else ""))
+
+        await self.Call(self.link.NotifyConnect, port)
+        reader = threading.Thread(target = read, daemon = True)
+        reader.start()
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            stop.set()
+
+    def Close(self):
+        """ Let the commands already queued finish, then stop the command worker. """
+        self.queue.shutdown(wait = True)
@@ -0,0 +1,192 @@
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+# File generated by RizomUV 2026.0.210.g19f9a6cf5 built on Aug 12 2026
+# Do not edit that file, it will be overridden soon.
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+# MIT License
+# 
+# Copyright (c) 2026 Rizom-Lab
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+try:
+	from win import rizomuvlink
+	CZEx = rizomuvlink.ZEx
+except ImportError:
+	# no compiled module for this platform: a link can still run on a backend it
+	# is given, CRizomUVLink(rizomuv = CRizomUVStandInPyd()) for instance
+	rizomuvlink = None
+	from RizomUVLinkArrays import CZEx
+
+
+# Compact form of RizomUVLinkBase.py, written by RizomUVLinkGen.py: do not edit,
+# generate it again. The commands are built from COMMANDS, their help text read
+# from RizomUVLinkBaseHelp.json the first time it is asked for.
+
+import os
+import types
+
+GENERATED_FROM = '# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #\n# File generated by RizomUV 2026.0.210.g19f9a6cf5 built on Aug 12 2026\n'
+HELP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'RizomUVLinkBaseHelp.json')
+
+def _GeneratedFrom(path):
+	try:
+		with open(path, encoding = "utf-8") as f:
+			return f.readline() + f.readline()
+	except OSError:
+		return None
+
+# made from another RizomUVLinkBase.py than the one next to it: let the importer
+# fall back to that one rather than offer commands it may not have
+if _GeneratedFrom(os.path.join(os.path.dirname(os.path.abspath(__file__)), "RizomUVLinkBase.py")) not in (None, GENERATED_FROM):
+	raise ImportError("RizomUVLinkBaseCompact.py is out of date, run RizomUVLinkGen.py again")
+
+_help = None
+
+def HelpText(commandName):
+	global _help
+	if _help is None:
+		import json
+		try:
+			with open(HELP_FILE, encoding = "utf-8") as f:
+				_help = json.load(f)
+		except OSError:
+			_help = {}
+	return _help.get(commandName)
+
+# A command method. Bound like a function, it runs Execute(name, params), or
+# function(link, params) when given one; its __doc__ is read from the help file.
+class CCommand:
+	def __init__(self, name, function = None):
+		self.__name__ = name
+		self.__qualname__ = "CRizomUVLinkBase." + name
+		self.function = function
+
+	@property
+	def __doc__(self):
+		return HelpText(self.__name__)
+
+	@property
+	def __signature__(self):
+		import inspect
+		return inspect.signature(self.function if self.function is not None else self.__call__)
+
+	def __get__(self, instance, owner = None):
+		if instance is None:
+			return self
+		return types.MethodType(self, instance)
+
+	def __call__(self, link, params = {}):
+		if self.function is not None:
+			return self.function(link, params)
+		return link.Execute(self.__name__, params)
+
+	def Wrap(self, function):
+		""" The same command running function instead, its help text still lazy """
+		return CCommand(self.__name__, function)
+
+COMMANDS = (
+	'Constrain', 'Count', 'Cut', 'Deform', 'Eval', 'Exit',
+	'GenPythonModule', 'GenerateCheckerboardTexture', 'GenerateHelp', 'GenerateScriptingHelp', 'Get', 'GetAsString',
+	'GetVersion', 'Hide', 'Hotspot', 'InitLib', 'IslandCopy', 'IslandGroups',
+	'IslandProperties', 'ItemNames', 'LibTaskEnd', 'LibTaskUpdate', 'Load', 'LoadControls',
+	'LoadGridTexture', 'LoadPrefs', 'LoadUserTexture', 'Loop', 'MigrateUserData', 'Optimize',
+	'Pack', 'PaintMap', 'PsExport', 'Quit', 'RasterExport', 'Redo',
+	'ResetControls', 'ResetPrefs', 'ResetTo3d', 'ResetVars', 'Save', 'SaveControls',
+	'SavePreferences', 'Select', 'Set', 'SnapshotFeatureTree', 'SnapshotWindowTree', 'Subscribe',
+	'SymmetrySet', 'Tag', 'Test', 'ToolbarLayout', 'TriggerFeature', 'UiEventLog',
+	'UiLayout', 'Undo', 'Unfold', 'Uvset', 'Weld',
+)
+
+class CRizomUVLinkBase:
+	def __init__(self):
+		self.rizomuv = rizomuvlink.RizomUVLinkPyd()
+		self.version = self.rizomuv.VersionString()
+		self.name = "RizomUV Link"
+		self.author = "remi.arquier at rizom-lab dot com"
+		self.description = "An open source Python module to control a RizomUV Standalone instance from a any Python capable application."
+		self.website = "https://rizomuv.com"
+
+	def Version(self):
+		""" Returns the version of the RizomUV Link module """
+		return self.version
+
+	def RizomUVVersion(self):
+		""" Returns the version of the connected RizomUV standalone program"""
+		return self.rizomuv.Execute("Get", "Vars.Infos.Version.Full", 10000)
+
+	def Execute(self, commandName, parameters):
+		return self.rizomuv.Execute(commandName, parameters, 2000)
+
+	def Connect(self, port : int):
+		self.rizomuv.Connect("tcp://127.0.0.1:" + str(port))
+
+	def TCPPortIsOpen(self, port: int):
+		return self.rizomuv.TCPPortIsOpen(port)
+
+	def NotifyConnect(self, port):
+		""" Connect the change-notification channel to the given port (the value
+		    returned by Subscribe). Lets you poll notifications yourself with
+		    NotifyPoll(); for a callback-driven loop use StartNotificationListener(). """
+		return self.rizomuv.NotifyConnect(port)
+
+	def NotifyPoll(self, timeout_ms = 0):
+		""" Wait up to timeout_ms (0 = non-blocking) for one change notification.
+		    Returns [path, version] for the next changed path, or [] on timeout. """
+		return self.rizomuv.NotifyPoll(timeout_ms)
+
+	def StartNotificationListener(self, port, callback, poll_ms = 200):
+		""" OPTIONAL: receive push notifications without polling GetVersion yourself.
+
+		    Call Subscribe({"Paths": [...]}) first; it returns the notification 'port'.
+		    Pass that port here with a callback(path, version) that fires whenever one
+		    of the subscribed data-tree paths changes. Returns a stop() function.
+
+		    This uses the notification channel built into the RizomUVLink module (no
+		    external dependency such as pyzmq). The listener runs on a background daemon
+		    thread, independent from the command channel, so you can keep issuing
+		    commands while receiving notifications. A notification carries no mesh data:
+		    on each callback, pull what you need with Get()/Save(). A long operation may
+		    fire several notifications (intermediate versions) - debounce if needed. """
+		import threading
+		self.rizomuv.NotifyConnect(port)
+		stop_evt = threading.Event()
+
+		def _loop():
+			while not stop_evt.is_set():
+				msg = self.rizomuv.NotifyPoll(poll_ms)  # [] or [path, version]
+				if msg:
+					try:
+						callback(msg[0], msg[1] if len(msg) > 1 else "")
+					except Exception:
+						pass
+
+		thread = threading.Thread(target = _loop, daemon = True)
+		thread.start()
+
+		def stop():
+			stop_evt.set()
+			thread.join(timeout = 2.0)
+		return stop
+
+for _name in COMMANDS:
+	setattr(CRizomUVLinkBase, _name, CCommand(_name))
+del _name
@@ -0,0 +1,154 @@
+# MIT License
+#
+# Copyright (c) 2026 Rizom-Lab
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+
+from collections import OrderedDict
+
+# the read commands a cache serves, all taking a dotted path string
+CACHED_COMMANDS = ("Get", "ItemNames", "Count", "Eval")
+
+
+def EstimateSize(value) -> int:
+    """ Rough size in bytes of a value read from the data tree, for eviction. """
+    if isinstance(value, dict):
+        return 64 + sum(len(str(k)) + EstimateSize(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        if value and isinstance(value[0], (int, float)):
+            return 64 + 32 * len(value)  # boxed numbers plus their slots
+        return 64 + sum(EstimateSize(v) for v in value)
+    if isinstance(value, str):
+        return 49 + len(value)
+    return 32
+
+
+def Overlaps(path : str, other : str) -> bool:
+    """ True when one path is the other or one of its ancestors. """
+    return path == other or path.startswith(other + ".") or other.startswith(path + ".")
+
+
+class CReadCache:
+    """ Results of Get, ItemNames, Count and Eval, kept while still valid.
+
+        An entry is checked before it is served, in one of two ways:
+
+          - by version: the recursive GetVersion token of the node read (of the
+            method's owner for Eval) is compared with the one taken when it was
+            read. A hit costs that one round trip, which transfers no data.
+          - by notification: entries under one of the watched paths are served
+            without asking anything, and dropped when a notification for an
+            overlapping path arrives (Notified, to be used as the listener
+            callback). Notifications are sent after each task, so a read right
+            after a command may still see the previous value: use this mode where
+            that is acceptable. Reads outside the watched paths are checked by
+            version.
+
+        A read racing with an invalidation is not stored: its value may predate
+        the change the invalidation was for (see generation).
+
+        Entries are evicted least recently used first once their estimated size
+        exceeds maxBytes. Values are shared between hits: treat them as read only.
+    """
+
+    def __init__(self, maxBytes : int = 64 * 1024 * 1024):
+        self.maxBytes = maxBytes
+        self.size = 0
+        self.entries = OrderedDict()  # (command, path) -> (value, version, size)
+        self.watched = ()
+        self.lock = threading.Lock()
+        self.generation = 0  # bumped by each invalidation
+        self.hits = 0
+        self.misses = 0
+
+    def VersionPath(self, commandName : str, path : str) -> str:
+        if commandName == "Eval":
+            return path.rsplit(".", 1)[0]
+        return path
+
+    def Watched(self, path : str) -> bool:
+        return any(path == w or path.startswith(w + ".") for w in self.watched)
+
+    def Read(self, link, commandName : str, path : str):
+        """ The value of commandName(path), from the cache when still valid. """
+        key = (commandName, path)
+        watched = self.Watched(path)
+        version = None
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is not None:
+            if not watched:
+                version = link.GetVersion({"Path": self.VersionPath(commandName, path), "Recursive": True})
+            if watched or version == entry[1]:
+                with self.lock:
+                    if key in self.entries:
+                        self.entries.move_to_end(key)
+                    self.hits += 1
+                return entry[0]
+
+        # the version is taken BEFORE the read: should the node change in between,
+        # the entry holds a stale version and the next check reads it again. A
+        # watched entry has no version to go stale: it is not stored at all when a
+        # notification came in while it was read
+        with self.lock:
+            generation = self.generation
+        if version is None and not watched:
+            version = link.GetVersion({"Path": self.VersionPath(commandName, path), "Recursive": True})
+        value = link.Execute(commandName, path)
+        self.Store(key, value, version, generation)
+        with self.lock:
+            self.misses += 1
+        return value
+
+    def Store(self, key, value, version, generation : int = None):
+        """ generation: self.generation when the read started, the value being
+            dropped if an invalidation happened since. """
+        size = EstimateSize(value)
+        if size > self.maxBytes:
+            return
+        with self.lock:
+            if generation is not None and generation != self.generation:
+                return
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous[2]
+            self.entries[key] = (value, version, size)
+            self.size += size
+            while self.size > self.maxBytes:
+                evicted = self.entries.popitem(last = False)[1]
+                self.size -= evicted[2]
+
+    def Invalidate(self, path : str):
+        """ Drop the entries of path, of its ancestors and of its descendants. """
+        with self.lock:
+            self.generation += 1
+            for key in [k for k in self.entries if Overlaps(k[1], path)]:
+                self.size -= self.entries.pop(key)[2]
+
+    def Notified(self, path : str, version = None):
+        """ Notification listener callback: path changed. """
+        self.Invalidate(path)
+
+    def Clear(self):
+        with self.lock:
+            self.generation += 1
+            self.entries.clear()
+            self.size = 0
@@ -0,0 +1,243 @@
+# MIT License
+#
+# Copyright (c) 2026 Rizom-Lab
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Compact form of the generated RizomUVLinkBase.py.
+#
+# RizomUVLinkBase.py is mostly help text: one method per command, each made of a
+# docstring and a single Execute() call. A host compiles and keeps all of it in
+# memory every time it loads a plugin using the link, whether help() is ever
+# called or not. This tool rewrites it as RizomUVLinkBaseCompact.py, where the
+# command methods are built from a table of names, and RizomUVLinkBaseHelp.json,
+# which holds their help text and is only read when a __doc__ is first asked for.
+# The methods written by hand (Execute, Connect, StartNotificationListener...) are
+# copied as they are. The parameter schemas parsed from the same help text go to
+# RizomUVLinkBaseSchemas.json (see RizomUVLinkSchema).
+#
+#     python RizomUVLinkGen.py [RizomUVLinkBase.py]
+#
+# RizomUVLink uses the compact module and the schemas when they were made from the
+# RizomUVLinkBase.py next to it, the full module and the help text otherwise: run
+# this again whenever RizomUVLinkBase.py is replaced by a new RizomUV release.
+
+import ast
+import json
+import os
+
+from RizomUVLinkSchema import ParseParameters
+from RizomUVLinkSchema import SCHEMA_FILE
+
+COMPACT_MODULE = "RizomUVLinkBaseCompact.py"
+HELP_FILE = "RizomUVLinkBaseHelp.json"
+
+COMPACT_TEMPLATE = '''{prologue}
+# Compact form of RizomUVLinkBase.py, written by RizomUVLinkGen.py: do not edit,
+# generate it again. The commands are built from COMMANDS, their help text read
+# from {helpFile} the first time it is asked for.
+
+import os
+import types
+
+GENERATED_FROM = {generatedFrom!r}
+HELP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), {helpFile!r})
+
+def _GeneratedFrom(path):
+	try:
+		with open(path, encoding = "utf-8") as f:
+			return f.readline() + f.readline()
+	except OSError:
+		return None
+
+# made from another RizomUVLinkBase.py than the one next to it: let the importer
+# fall back to that one rather than offer commands it may not have
+if _GeneratedFrom(os.path.join(os.path.dirname(os.path.abspath(__file__)), "RizomUVLinkBase.py")) not in (None, GENERATED_FROM):
+	raise ImportError("RizomUVLinkBaseCompact.py is out of date, run RizomUVLinkGen.py again")
+
+_help = None
+
+def HelpText(commandName):
+	global _help
+	if _help is None:
+		import json
+		try:
+			with open(HELP_FILE, encoding = "utf-8") as f:
+				_help = json.load(f)
+		except OSError:
+			_help = {{}}
+	return _help.get(commandName)
+
+# A command method. Bound like a function, it runs Execute(name, params), or
+# function(link, params) when given one; its __doc__ is read from the help file.
+class CCommand:
+	def __init__(self, name, function = None):
+		self.__name__ = name
+		self.__qualname__ = "CRizomUVLinkBase." + name
+		self.function = function
+
+	@property
+	def __doc__(self):
+		return HelpText(self.__name__)
+
+	@property
+	def __signature__(self):
+		import inspect
+		return inspect.signature(self.function if self.function is not None else self.__call__)
+
+	def __get__(self, instance, owner = None):
+		if instance is None:
+			return self
+		return types.MethodType(self, instance)
+
+	def __call__(self, link, params = {{}}):
+		if self.function is not None:
+			return self.function(link, params)
+		return link.Execute(self.__name__, params)
+
+	def Wrap(self, function):
+		""" The same command running function instead, its help text still lazy """
+		return CCommand(self.__name__, function)
+
+COMMANDS = (
+{commands}
+)
+
+class CRizomUVLinkBase:
+{methods}
+
+for _name in COMMANDS:
+	setattr(CRizomUVLinkBase, _name, CCommand(_name))
+del _name
+'''
+
+
+def IsCommand(node) -> bool:
+    """ True for a generated command method: def X(self, params = {}) whose body
+        is a docstring and return self.Execute('X', params). """
+    if not isinstance(node, ast.FunctionDef) or node.decorator_list or len(node.body) != 2:
+        return False
+    args = node.args
+    if [a.arg for a in args.args] != ["self", "params"] or len(args.defaults) != 1:
+        return False
+    if not isinstance(args.defaults[0], ast.Dict) or args.defaults[0].keys:
+        return False
+    if ast.get_docstring(node, clean = False) is None:
+        return False
+    call = node.body[1].value if isinstance(node.body[1], ast.Return) else None
+    return (isinstance(call, ast.Call) and not call.keywords and len(call.args) == 2
+            and isinstance(call.func, ast.Attribute) and call.func.attr == "Execute"
+            and isinstance(call.func.value, ast.Name) and call.func.value.id == "self"
+            and isinstance(call.args[0], ast.Constant) and call.args[0].value == node.name
+            and isinstance(call.args[1], ast.Name) and call.args[1].id == "params")
+
+
+OPTIONAL_IMPORT = '''try:
+	from win import rizomuvlink
+	CZEx = rizomuvlink.ZEx
+except ImportError:
+	# no compiled module for this platform: a link can still run on a backend it
+	# is given, CRizomUVLink(rizomuv = CRizomUVStandInPyd()) for instance
+	rizomuvlink = None
+	from RizomUVLinkArrays import CZEx
+'''
+
+
+def OptionalImport(prologue : str) -> str:
+    """ The prologue, its import of the compiled module, and the CZEx taken from
+        it, made to fail softly: the compact module then loads on any platform. """
+    tree = ast.parse(prologue)
+    lines = prologue.splitlines(keepends = True)
+    drop = []
+    for node in tree.body:
+        if (isinstance(node, ast.ImportFrom) and node.module == "win"
+                and [a.name for a in node.names] == ["rizomuvlink"] and not node.names[0].asname):
+            drop.append(node)
+        elif (isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name)
+                and node.targets[0].id == "CZEx" and ast.unparse(node.value) == "rizomuvlink.ZEx"):
+            drop.append(node)
+    if len(drop) != 2:
+        return prologue
+    for node in reversed(drop):
+        del lines[node.lineno - 1:node.end_lineno]
+        if node is drop[0]:
+            lines.insert(node.lineno - 1, OPTIONAL_IMPORT)
+    return "".join(lines)
+
+
+def ParseBase(source : str) -> tuple:
+    """ (prologue, hand written methods, {command name: help text}) of a generated
+        RizomUVLinkBase.py source. The prologue is everything before the class. """
+    tree = ast.parse(source)
+    base = [node for node in tree.body if isinstance(node, ast.ClassDef) and node.name == "CRizomUVLinkBase"]
+    if not base:
+        raise ValueError("No CRizomUVLinkBase class in that source")
+    base = base[0]
+    lines = source.splitlines(keepends = True)
+    prologue = "".join(lines[:base.lineno - 1]).rstrip() + "\n"
+
+    methods = []
+    commands = {}
+    for node in base.body:
+        if IsCommand(node):
+            commands[node.name] = ast.get_docstring(node, clean = False)
+        else:
+            methods.append(ast.get_source_segment(source, node, padded = True))
+    return prologue, methods, commands
+
+
+def Generate(basePath : str, outputDirectory : str = None) -> tuple:
+    """ Write the compact module, its help file and the parameter schemas next to
+        basePath, or in outputDirectory. Returns their paths. """
+    with open(basePath, encoding = "utf-8") as f:
+        source = f.read()
+    prologue, methods, commands = ParseBase(source)
+    if outputDirectory is None:
+        outputDirectory = os.path.dirname(os.path.abspath(basePath))
+
+    names = list(commands)
+    table = "\n".join("\t" + " ".join(repr(n) + "," for n in names[i:i + 6]) for i in range(0, len(names), 6))
+    header = source.splitlines(keepends = True)
+    compact = COMPACT_TEMPLATE.format(prologue = OptionalImport(prologue), helpFile = HELP_FILE,
+                                      generatedFrom = "".join(header[:2]),
+                                      commands = table, methods = "\n\n".join(methods))
+
+    modulePath = os.path.join(outputDirectory, COMPACT_MODULE)
+    helpPath = os.path.join(outputDirectory, HELP_FILE)
+    with open(modulePath, "w", encoding = "utf-8") as f:
+        f.write(compact)
+    with open(helpPath, "w", encoding = "utf-8") as f:
+        json.dump(commands, f, indent = 0, sort_keys = True)
+
+    schemas = {name: ParseParameters(text) for name, text in commands.items()}
+    schemaPath = os.path.join(outputDirectory, SCHEMA_FILE)
+    with open(schemaPath, "w", encoding = "utf-8") as f:
+        json.dump({"GeneratedFrom": "".join(header[:2]),
+                   "Schemas": {name: schema for name, schema in schemas.items() if schema}}, f, indent = 1, sort_keys = True)
+    return modulePath, helpPath, schemaPath
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description = "Write the compact form of RizomUVLinkBase.py")
+    parser.add_argument("base", nargs = "?", default = os.path.join(os.path.dirname(os.path.abspath(__file__)), "RizomUVLinkBase.py"))
+    parser.add_argument("--output", help = "directory to write into, the one of base by default")
+    args = parser.parse_args()
+    for path in Generate(args.base, args.output):
+        print("Wrote " + path)
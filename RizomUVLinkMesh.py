@@ -0,0 +1,607 @@
+# MIT License
+#
+# Copyright (c) 2026 Rizom-Lab
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Mesh side helpers for bridges. They work on NumPy arrays, which is therefore
+# needed here, unlike in the rest of the module.
+
+import numpy
+
+from RizomUVLinkArrays import CZEx
+
+
+class CUVWTracker:
+    """ Pushes UVs to an instance, sending only what changed since last time.
+
+        A host side tool moving a few islands should not have to resend every UV
+        of the mesh. The tracker remembers the UVW buffer last exchanged with the
+        instance -- pushed with Push(), or pulled with Pull() -- and on the next
+        Push() compares the new one with it, vertex by vertex. The vertices that
+        moved go out through Load's Data.CoordsUVWPartial, which addresses a UVW
+        vertex by a polygon vertex using it, a (polygon, corner) pair:
+
+            {"PolyVertIDs": [p0 c0 p1 c1 ...], "UVWs": [u0 v0 w0 u1 v1 w1 ...]}
+
+        That takes the UV topology, PolySizes and PolyUVWIDs: Pull() gets it, a
+        Push() whose params hold it takes it, or SetTopology() gives it. Without
+        it, or past maxChangeRatio of the vertices, or when the vertex count changed,
+        the whole buffer goes out through Data.CoordsUVW instead, a partial update
+        of most of the mesh costing more than a full one. tolerance is the largest
+        coordinate difference still considered unchanged.
+
+        The tracker only knows what went through it: call Pull(), or Reset(), when
+        the UVs may have changed on the RizomUV side.
+    """
+
+    def __init__(self, link, maxChangeRatio : float = 0.25, tolerance : float = 0.0):
+        self.link = link
+        self.maxChangeRatio = maxChangeRatio
+        self.tolerance = tolerance
+        self.last = None
+        self.polyVerts = None
+
+    def SetTopology(self, polySizes, polyUVWIDs):
+        """ The UV topology of the mesh: the polygon sizes and the UVW vertex id of
+            each polygon vertex. None forgets it, which makes every Push() full. """
+        if polySizes is None or polyUVWIDs is None:
+            self.polyVerts = None
+            return
+        sizes = numpy.asarray(polySizes, dtype = numpy.int64)
+        ids = numpy.asarray(polyUVWIDs, dtype = numpy.int64)
+        offsets = numpy.zeros(len(sizes) + 1, dtype = numpy.int64)
+        numpy.cumsum(sizes, out = offsets[1:])
+        if offsets[-1] != len(ids):
+            raise CZEx("The polygon sizes sum up to " + str(offsets[-1]) + " but there are " + str(len(ids)) + " UVW vertex ids")
+        # for each UVW vertex, the first polygon vertex using it: [polygon, corner],
+        # -1 for the vertices no polygon uses
+        vertexCount = int(ids.max()) + 1 if len(ids) else 0
+        first = numpy.full(vertexCount, len(ids), dtype = numpy.int64)
+        numpy.minimum.at(first, ids, numpy.arange(len(ids), dtype = numpy.int64))
+        used = first < len(ids)
+        polygons = numpy.searchsorted(offsets, first[used], side = "right") - 1
+        self.polyVerts = numpy.full((vertexCount, 2), -1, dtype = numpy.int32)
+        self.polyVerts[used, 0] = polygons
+        self.polyVerts[used, 1] = first[used] - offsets[polygons]
+
+    def Reset(self):
+        """ Forget the last buffer: the next Push() sends everything. """
+        self.last = None
+
+    def Changed(self, uvws) -> "numpy.ndarray":
+        """ The ids of the vertices of uvws that differ from the last buffer. """
+        current = numpy.ascontiguousarray(uvws, dtype = numpy.float64).reshape(-1, 3)
+        if self.tolerance > 0.0:
+            moved = numpy.abs(current - self.last.reshape(-1, 3)) > self.tolerance
+        else:
+            moved = current != self.last.reshape(-1, 3)
+        return numpy.flatnonzero(moved.any(axis = 1))
+
+    def Push(self, uvws, params : dict = None) -> int:
+        """ Send uvws, the flat [u0 v0 w0 u1 ...] coordinates or an (n, 3) array,
+            with whatever Load() parameters params adds. Returns the number of
+            vertices sent: 0 when nothing changed, in which case nothing is sent.
+        """
+        current = numpy.ascontiguousarray(uvws, dtype = numpy.float64).reshape(-1)
+        if len(current) % 3 != 0:
+            raise CZEx("UVW coordinates come by three: got " + str(len(current)) + " values")
+        load = dict(params) if params else {}
+        count = len(current) // 3
+
+        if "Data.PolySizes" in load and "Data.PolyUVWIDs" in load:
+            self.SetTopology(load["Data.PolySizes"], load["Data.PolyUVWIDs"])
+            self.last = None
+        if self.last is None or len(self.last) != len(current):
+            load["Data.CoordsUVW"] = current
+        else:
+            changed = self.Changed(current)
+            if len(changed) == 0:
+                return 0
+            polyVerts = None
+            if self.polyVerts is not None and len(changed) <= self.maxChangeRatio * count and changed[-1] < len(self.polyVerts):
+                polyVerts = self.polyVerts[changed]
+                if (polyVerts < 0).any():
+                    polyVerts = None  # a vertex no polygon uses cannot be addressed
+            if polyVerts is None:
+                load["Data.CoordsUVW"] = current
+            else:
+                count = len(changed)
+                load["Data.CoordsUVWPartial"] = {
+                    "PolyVertIDs": polyVerts.reshape(-1),
+                    "UVWs": current.reshape(-1, 3)[changed].reshape(-1),
+                }
+
+        self.link.Load(load)
+        self.last = current.copy()
+        return count
+
+    def Pull(self, params : dict = None) -> dict:
+        """ SaveArrays() remembering the UVs it brought back as the last buffer. """
+        output = self.link.SaveArrays(params, useNumpy = True)
+        data = output.get("Data", {})
+        uvws = data.get("CoordsUVW")
+        self.last = None if uvws is None else numpy.array(uvws, dtype = numpy.float64)
+        self.SetTopology(data.get("PolySizes"), data.get("PolyUVWIDs"))
+        return output
+
+
+def _Coordinates(coords, name : str) -> "numpy.ndarray":
+    """ coords as a flat float64 array of xyz triplets: flat already, (n, 3), or
+        (n, 2) completed with zero w's. """
+    coords = numpy.asarray(coords, dtype = numpy.float64)
+    if coords.ndim == 2 and coords.shape[1] == 2:
+        coords = numpy.hstack([coords, numpy.zeros((len(coords), 1))])
+    elif coords.ndim == 2 and coords.shape[1] != 3:
+        raise CZEx(name + " must hold 2 or 3 coordinates per vertex, not " + str(coords.shape[1]))
+    coords = numpy.ascontiguousarray(coords).reshape(-1)
+    if len(coords) % 3 != 0:
+        raise CZEx(name + " holds " + str(len(coords)) + " values, which is not 3 per vertex")
+    return coords
+
+
+def _Int32(ids, name : str) -> "numpy.ndarray":
+    """ ids as a contiguous int32 array, refusing the values that would wrap. """
+    ids = numpy.asarray(ids)
+    if ids.dtype.itemsize > 4 and len(ids) and (ids.max() > 2147483647 or ids.min() < -2147483648):
+        raise CZEx(name + " holds values beyond the 32 bit integers the link transfers")
+    return numpy.ascontiguousarray(ids, dtype = numpy.int32)
+
+
+def _Polygons(faces, sizes, offsets, name : str) -> tuple:
+    """ (sizes, flat ids) of polygons given as an (n, k) array, or as flat ids with
+        their sizes or offsets. """
+    faces = numpy.asarray(faces)
+    if faces.ndim == 2:
+        if sizes is not None or offsets is not None:
+            raise CZEx(name + ": an (n, k) array of polygons takes no sizes nor offsets")
+        return numpy.full(len(faces), faces.shape[1], dtype = numpy.int32), faces.reshape(-1)
+    if faces.ndim != 1:
+        raise CZEx(name + " must be an (n, k) array, or flat ids with sizes or offsets")
+    if sizes is not None:
+        if offsets is not None:
+            raise CZEx(name + ": give sizes or offsets, not both")
+        return numpy.asarray(sizes), faces
+    if offsets is None:
+        raise CZEx(name + ": flat ids need sizes or offsets")
+    offsets = numpy.asarray(offsets)
+    if len(offsets) == 0 or offsets[0] != 0:
+        raise CZEx(name + ": offsets must start at 0")
+    if offsets[-1] != len(faces):
+        # offsets of each polygon's first id only: the end is implied
+        offsets = numpy.append(offsets, len(faces))
+    return numpy.diff(offsets), faces
+
+
+class CMeshData:
+    """ Load() parameters of a mesh, made from NumPy arrays and checked.
+
+        Polygons come as an (n, k) array of vertex ids when they all have k
+        vertices, or as the flat ids of all polygons along with either their sizes
+        or their offsets (the index of each polygon's first id, with or without
+        the final end). Coordinates come as (m, 3) arrays or flat [x0 y0 z0 x1 ...]
+        ones; UVs may be (p, 2). The UV topology, when given, is laid out like the
+        polygons:
+
+            mesh = CMeshData(triangles, points)
+            mesh = CMeshData(ids, points, offsets = starts, uvwFaces = uvIds, coordsUVW = uvs)
+            link.Load(mesh.Parameters())
+
+        Check() verifies the structure -- at least 3 vertices per polygon, sizes
+        summing to the id count, every id within its coordinates, the UV topology
+        matching the 3D one -- with array operations only, and raises a CZEx
+        naming the first offending polygon. The constructor calls it.
+
+        triangles, the tessellation of the polygons by the host (size - 2
+        triangles per polygon, in polygon order), unlocks Load's fast import
+        through Data.TriangleXYZID, which skips the topology tests of RizomUV and
+        trusts the mesh to pass them. Parameters() only sends it when
+        TopologyProblems() finds nothing wrong, and leaves RizomUV to tessellate
+        and test the mesh otherwise. Triangulate() computes one when the host has
+        none to give.
+    """
+
+    def __init__(self, faces, coordsXYZ, sizes = None, offsets = None, uvwFaces = None, coordsUVW = None,
+                 triangles = None):
+        polySizes, xyzIDs = _Polygons(faces, sizes, offsets, "faces")
+        self.polySizes = _Int32(polySizes, "sizes")
+        self.xyzIDs = _Int32(xyzIDs, "faces")
+        self.coordsXYZ = _Coordinates(coordsXYZ, "coordsXYZ")
+        self.uvwIDs = None
+        self.coordsUVW = None
+        if (uvwFaces is None) != (coordsUVW is None):
+            raise CZEx("uvwFaces and coordsUVW come together")
+        if uvwFaces is not None:
+            self.uvwIDs = _Int32(numpy.asarray(uvwFaces).reshape(-1), "uvwFaces")
+            self.coordsUVW = _Coordinates(coordsUVW, "coordsUVW")
+        self.triangleIDs = None if triangles is None else _Int32(numpy.asarray(triangles).reshape(-1), "triangles")
+        self.problems = None
+        self.Check()
+
+    def PolygonCount(self) -> int:
+        return len(self.polySizes)
+
+    def Offsets(self) -> "numpy.ndarray":
+        """ Index of each polygon's first id, plus the id count at the end. """
+        offsets = numpy.zeros(len(self.polySizes) + 1, dtype = numpy.int64)
+        numpy.cumsum(self.polySizes, out = offsets[1:])
+        return offsets
+
+    def Check(self):
+        sizes = self.polySizes
+        small = numpy.flatnonzero(sizes < 3)
+        if len(small):
+            raise CZEx("Polygon " + str(small[0]) + " has " + str(sizes[small[0]]) + " vertices, 3 at least are needed")
+        total = int(sizes.sum(dtype = numpy.int64))
+        if total != len(self.xyzIDs):
+            raise CZEx("The polygon sizes sum up to " + str(total) + " but there are " + str(len(self.xyzIDs)) + " vertex ids")
+        self.CheckIDs(self.xyzIDs, len(self.coordsXYZ) // 3, "3D")
+        if self.uvwIDs is not None:
+            if len(self.uvwIDs) != len(self.xyzIDs):
+                raise CZEx("There are " + str(len(self.uvwIDs)) + " UVW vertex ids for " + str(len(self.xyzIDs)) + " 3D ones")
+            self.CheckIDs(self.uvwIDs, len(self.coordsUVW) // 3, "UVW")
+        if self.triangleIDs is not None:
+            expected = total - 2 * len(sizes)
+            if len(self.triangleIDs) != 3 * expected:
+                raise CZEx("There are " + str(len(self.triangleIDs)) + " triangle vertex ids, "
+                           + str(3 * expected) + " expected for " + str(expected) + " triangles")
+            bad = numpy.flatnonzero((self.triangleIDs < 0) | (self.triangleIDs >= len(self.coordsXYZ) // 3))
+            if len(bad):
+                raise CZEx("Triangle " + str(bad[0] // 3) + " refers to the 3D vertex " + str(self.triangleIDs[bad[0]])
+                           + ", there are " + str(len(self.coordsXYZ) // 3))
+
+    def CheckIDs(self, ids, vertexCount : int, space : str):
+        bad = numpy.flatnonzero((ids < 0) | (ids >= vertexCount))
+        if len(bad):
+            polygon = int(numpy.searchsorted(self.Offsets(), bad[0], side = "right")) - 1
+            raise CZEx("Polygon " + str(polygon) + " refers to the " + space + " vertex " + str(ids[bad[0]])
+                       + ", there are " + str(vertexCount))
+
+    def Triangulate(self, workers : int = 1) -> "CMeshData":
+        """ Use Triangulate() of the polygons as the triangles, and return self. """
+        self.triangleIDs = Triangulate(self.polySizes, self.xyzIDs, self.coordsXYZ, workers)
+        self.problems = None
+        return self
+
+    def TopologyProblems(self) -> dict:
+        """ TopologyProblems() of the triangles, computed once; {} without
+            triangles. """
+        if self.problems is None:
+            self.problems = {} if self.triangleIDs is None else TopologyProblems(
+                self.triangleIDs, len(self.coordsXYZ) // 3, self.polySizes, self.xyzIDs)
+        return self.problems
+
+    def FastImport(self) -> bool:
+        """ True when Load can take the triangles and skip its topology tests. """
+        return self.triangleIDs is not None and not self.TopologyProblems()
+
+    def Parameters(self, fastImport : bool = None) -> dict:
+        """ The Data.* parameters of Load(). fastImport: None to send the triangles
+            when FastImport() says so, True to send them unchecked, False never. """
+        parameters = {"Data.PolySizes": self.polySizes, "Data.PolyXYZIDs": self.xyzIDs,
+                      "Data.CoordsXYZ": self.coordsXYZ}
+        if self.uvwIDs is not None:
+            parameters["Data.PolyUVWIDs"] = self.uvwIDs
+            parameters["Data.CoordsUVW"] = self.coordsUVW
+        if fastImport is None:
+            fastImport = self.FastImport()
+        if fastImport and self.triangleIDs is not None:
+            parameters["Data.TriangleXYZID"] = self.triangleIDs
+        return parameters
+
+
+# lockstep steps of the fan walks of TopologyProblems(), before pointer doubling
+# takes over
+_LOCKSTEP_WALK = 64
+
+
+def TopologyProblems(triangles, vertexCount : int, polySizes = None, polyIDs = None) -> dict:
+    """ The Data.TriangleXYZID rules a mesh breaks, as {rule: (count, example)}:
+        an empty dict when Load can take the triangles without its own topology
+        tests. triangles is an (n, 3) or flat array of 3D vertex ids.
+
+          "InvalidIndices"      a triangle using a vertex id outside of
+                                [0, vertexCount). Example: its index. The other
+                                rules are not looked at then
+          "DegeneratePolygons"  a triangle, or polygon when polySizes and polyIDs
+                                are given, using a vertex twice. Example: its index
+          "IsolatedVertices"    a vertex no triangle uses. Example: the vertex
+          "SingularEdges"       an edge of more than 2 triangles. Example: its
+                                vertices
+          "Orientation"         an edge two triangles run in the same direction,
+                                a Moebius strip. Example: its vertices
+          "SingularVertices"    a vertex whose triangles do not form a single fan
+                                of triangles sharing edges. Example: the vertex
+
+        Only array operations are used: a few million triangles take well under
+        a second. Edges and vertices are not looked at when there are degenerate
+        triangles, and each of the last three rules only when the ones before it
+        pass, as they rely on them.
+    """
+    tris = numpy.asarray(triangles, dtype = numpy.int64).reshape(-1, 3)
+    problems = {}
+
+    def report(rule, bad, examples):
+        if len(bad):
+            problems[rule] = (int(len(bad)), examples)
+
+    if len(tris) and (tris.min() < 0 or tris.max() >= vertexCount):
+        outside = numpy.flatnonzero((tris < 0).any(axis = 1) | (tris >= vertexCount).any(axis = 1))
+        report("InvalidIndices", outside, int(outside[0]))
+        return problems
+
+    degenerate = numpy.flatnonzero((tris[:, 0] == tris[:, 1]) | (tris[:, 1] == tris[:, 2]) | (tris[:, 0] == tris[:, 2]))
+    report("DegeneratePolygons", degenerate, int(degenerate[0]) if len(degenerate) else None)
+    if polySizes is not None and polyIDs is not None and "DegeneratePolygons" not in problems:
+        sizes = numpy.asarray(polySizes, dtype = numpy.int64)
+        owner = numpy.repeat(numpy.arange(len(sizes), dtype = numpy.int64), sizes)
+        keys = numpy.sort(owner * vertexCount + numpy.asarray(polyIDs, dtype = numpy.int64))
+        twice = numpy.flatnonzero(keys[1:] == keys[:-1])
+        report("DegeneratePolygons", twice, int(keys[twice[0]] // vertexCount) if len(twice) else None)
+
+    used = numpy.bincount(tris.reshape(-1), minlength = vertexCount)
+    isolated = numpy.flatnonzero(used == 0)
+    report("IsolatedVertices", isolated, int(isolated[0]) if len(isolated) else None)
+
+    if "DegeneratePolygons" in problems:
+        return problems
+
+    # edges, one per corner: corner 3t+i starts the edge v_i -> v_i+1. Sorted by
+    # their vertices in either direction, the corners of an edge come together:
+    # alone on a border, by two inside, by more on a singular edge.
+    starts = tris.reshape(-1)
+    ends = tris[:, [1, 2, 0]].reshape(-1)
+    forward = starts < ends
+    keys = numpy.where(forward, starts, ends) * vertexCount + numpy.where(forward, ends, starts)
+    shift = len(keys).bit_length()
+    if (vertexCount * vertexCount).bit_length() + shift <= 63:
+        # the corner packed below the key: a plain sort, 3 times faster than argsort
+        packed = numpy.sort((keys << shift) | numpy.arange(len(keys), dtype = numpy.int64))
+        order = packed & ((1 << shift) - 1)
+        keys = packed >> shift
+    else:
+        order = numpy.argsort(keys)
+        keys = keys[order]
+    singular = numpy.flatnonzero(keys[2:] == keys[:-2])
+    if len(singular):
+        singular = numpy.unique(keys[singular])
+        report("SingularEdges", singular, divmod(int(singular[0]), vertexCount))
+        return problems
+
+    pairs = numpy.flatnonzero(keys[1:] == keys[:-1])
+    first, second = order[pairs], order[pairs + 1]
+    flipped = numpy.flatnonzero(forward[first] == forward[second])
+    report("Orientation", flipped, (int(starts[first[flipped[0]]]), int(ends[first[flipped[0]]])) if len(flipped) else None)
+    if "Orientation" in problems:
+        return problems
+
+    # around each vertex, step from triangle to triangle across the edge leaving
+    # the vertex: the corner at v of the triangle running that edge backwards.
+    # Consistent orientation makes this a partial permutation of the corners,
+    # whose orbits are the fans: a path from a border edge, or a closed cycle.
+    cornerCount = len(starts)
+    corners = numpy.arange(cornerCount, dtype = numpy.int32)
+    first = first.astype(numpy.int32)
+    second = second.astype(numpy.int32)
+    afterFirst = first + numpy.where(first % 3 == 2, -2, 1).astype(numpy.int32)    # the corner after it in
+    afterSecond = second + numpy.where(second % 3 == 2, -2, 1).astype(numpy.int32)  # its triangle: at v_i+1
+    successor = corners.copy()                                  # path ends point to themselves
+    successor[first] = afterSecond
+    successor[second] = afterFirst
+    hasPredecessor = numpy.zeros(cornerCount, dtype = bool)
+    hasPredecessor[afterFirst] = True
+    hasPredecessor[afterSecond] = True
+
+    # a vertex is fine when the walk from one of its corners -- a path start if
+    # it is on a border -- goes through all of them. Walks run in lockstep, one
+    # step for all vertices at a time; the few around the highest valences are
+    # left to pointer doubling.
+    pathStarts = corners[~hasPredecessor]
+    startCounts = numpy.bincount(starts[pathStarts], minlength = vertexCount)
+    origin = numpy.empty(vertexCount, dtype = numpy.int32)
+    origin[starts[::-1]] = corners[::-1]
+    origin[starts[pathStarts]] = pathStarts
+    vertices = numpy.flatnonzero((startCounts <= 1) & (used > 0))
+    walker = origin[vertices]
+    start = walker
+    walked = numpy.ones(len(vertices), dtype = numpy.int64)
+    fanned = numpy.zeros(vertexCount, dtype = numpy.int64)
+    for i in range(_LOCKSTEP_WALK):
+        following = successor[walker]
+        done = (following == walker) | (following == start)
+        fanned[vertices[done]] = walked[done]
+        running = ~done
+        vertices, walker, start, walked = vertices[running], following[running], start[running], walked[running] + 1
+        if not len(vertices):
+            break
+    if len(vertices):
+        single = _FanCounts(successor, starts, vertexCount)[vertices] == 1
+        fanned[vertices] = numpy.where(single, used[vertices], 0)
+    singular = numpy.flatnonzero(fanned != used)
+    report("SingularVertices", singular, int(singular[0]) if len(singular) else None)
+    return problems
+
+
+def _FanCounts(successor, starts, vertexCount : int) -> "numpy.ndarray":
+    """ The number of fans around each vertex: of orbits of successor, paths
+        ending on a corner that is its own successor, or cycles. """
+    corners = numpy.arange(len(successor), dtype = numpy.int32)
+    hasPredecessor = numpy.zeros(len(successor), dtype = bool)
+    hasPredecessor[successor[successor != corners]] = True
+    # pointer doubling: label is the smallest corner among the first 2^k ones of
+    # each orbit, -1 once a path end is among them. When a round changes nothing,
+    # a longer window would not either: the label is the whole orbit's, -1 on
+    # the paths, and on the cycles the smallest corner.
+    jump = successor
+    label = numpy.where(successor == corners, -1, corners).astype(numpy.int32)
+    while True:
+        labelNext = numpy.minimum(label, label[jump])
+        if numpy.array_equal(labelNext, label):
+            break
+        label = labelNext
+        jump = jump[jump]
+    # one fan per path start, and one per cycle, counted at its smallest corner
+    fanStarts = (label == corners) | ((label < 0) & ~hasPredecessor)
+    return numpy.bincount(starts[fanStarts], minlength = vertexCount)
+
+
+# ear clipping compares every vertex of a polygon with every other: the
+# polygons of a size are clipped by chunks holding about that many pairs
+_EAR_CLIPPING_PAIRS = 1 << 20
+
+
+def _Cross(ax, ay, bx, by, cx, cy):
+    """ z of (b - a) x (c - a): positive when a, b, c turn counterclockwise. """
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+
+def _Projected(coords, ids) -> tuple:
+    """ x and y, both (n, k), of the vertices of n polygons of k vertices, ids
+        (n, k), projected on the plane of the largest component of their Newell
+        normal, and the sign of each polygon's area on that plane. """
+    following = numpy.roll(numpy.arange(ids.shape[1]), -1)
+    x, y, z = coords[ids, 0], coords[ids, 1], coords[ids, 2]
+    xn, yn, zn = x[:, following], y[:, following], z[:, following]
+    # each component is twice the area of the projection on the other two axes
+    normal = numpy.stack([((y - yn) * (z + zn)).sum(axis = 1), ((z - zn) * (x + xn)).sum(axis = 1),
+                          ((x - xn) * (y + yn)).sum(axis = 1)], axis = 1)
+    axis = numpy.abs(normal).argmax(axis = 1)
+    area = normal[numpy.arange(len(axis)), axis]
+    axis = axis[:, None]
+    u = numpy.where(axis == 0, y, numpy.where(axis == 1, z, x))
+    v = numpy.where(axis == 0, z, numpy.where(axis == 1, x, y))
+    return u, v, numpy.where(area < 0.0, -1.0, 1.0)
+
+
+def _EarClipping(x, y, orientation) -> "numpy.ndarray":
+    """ (n, k - 2, 3) local vertex indices of the triangles of n polygons of k
+        vertices. The polygons are clipped all at once, one ear per polygon and
+        step: the first convex vertex whose triangle holds no other vertex, or
+        the first vertex left when a broken polygon has no such ear. """
+    n, k = x.shape
+    rows = numpy.arange(n)[:, None]
+    row = rows[:, 0]
+    indices = numpy.arange(k)
+    following = numpy.tile((indices + 1) % k, (n, 1))
+    previous = numpy.tile((indices - 1) % k, (n, 1))
+    alive = numpy.ones((n, k), dtype = bool)
+    triangles = numpy.empty((n, k - 2, 3), dtype = numpy.int64)
+    sign = orientation[:, None]
+    for step in range(k - 3):
+        ax, ay = x[rows, previous], y[rows, previous]
+        cx, cy = x[rows, following], y[rows, following]
+        convex = _Cross(ax, ay, x, y, cx, cy) * sign > 0.0
+        # vertex j in the triangle of ear i: (n, i, j)
+        px, py = x[:, None, :], y[:, None, :]
+        inside = ((_Cross(ax[:, :, None], ay[:, :, None], x[:, :, None], y[:, :, None], px, py) * sign[:, :, None] >= 0.0)
+                  & (_Cross(x[:, :, None], y[:, :, None], cx[:, :, None], cy[:, :, None], px, py) * sign[:, :, None] >= 0.0)
+                  & (_Cross(cx[:, :, None], cy[:, :, None], ax[:, :, None], ay[:, :, None], px, py) * sign[:, :, None] >= 0.0))
+        inside &= alive[:, None, :]
+        inside &= indices[None, None, :] != indices[None, :, None]
+        inside &= indices[None, None, :] != previous[:, :, None]
+        inside &= indices[None, None, :] != following[:, :, None]
+        ears = convex & alive & ~inside.any(axis = 2)
+        ear = numpy.where(ears.any(axis = 1), ears.argmax(axis = 1), alive.argmax(axis = 1))
+        before, after = previous[row, ear], following[row, ear]
+        triangles[:, step] = numpy.stack([before, ear, after], axis = 1)
+        following[row, before] = after
+        previous[row, after] = before
+        alive[row, ear] = False
+    ear = alive.argmax(axis = 1)
+    triangles[:, k - 3] = numpy.stack([previous[row, ear], ear, following[row, ear]], axis = 1)
+    return triangles
+
+
+def Triangulate(polySizes, polyIDs, coordsXYZ, workers : int = 1) -> "numpy.ndarray":
+    """ Data.TriangleXYZID of a polygon mesh: the flat int32 vertex ids of size - 2
+        triangles per polygon, in polygon order, each running the way its polygon
+        does.
+
+        Polygons are handled by batches of the same size. A convex one becomes a
+        fan from its first vertex; the others, once projected on the plane their
+        normal is the closest to, are ear clipped. Fans cost a few array
+        operations per size; ear clipping grows with the cube of the size, which
+        only matters for the rare concave polygon of hundreds of vertices.
+
+        workers above 1 splits the polygons in as many ranges, triangulated by a
+        pool of processes. Each range is sent the coordinates of the vertices it
+        uses only, not the whole mesh's once per range. Starting the processes
+        and sending them their ranges costs more than a single process spends
+        on a million quads, so it can only pay off with as many idle cores and
+        a mesh well past that: measure before relying on it. On Windows, the
+        call must then come from the main module's if __name__ == "__main__"
+        block, or from a module it imports.
+    """
+    sizes = numpy.asarray(polySizes, dtype = numpy.int64)
+    ids = numpy.asarray(polyIDs)
+    coords = numpy.asarray(coordsXYZ, dtype = numpy.float64).reshape(-1, 3)
+    offsets = numpy.zeros(len(sizes) + 1, dtype = numpy.int64)
+    numpy.cumsum(sizes, out = offsets[1:])
+    if offsets[-1] != len(ids):
+        raise CZEx("The polygon sizes sum up to " + str(offsets[-1]) + " but there are " + str(len(ids)) + " vertex ids")
+    if len(sizes) and sizes.min() < 3:
+        raise CZEx("Polygon " + str(numpy.argmin(sizes)) + " has less than 3 vertices")
+
+    if workers > 1 and len(sizes) > workers:
+        from concurrent.futures import ProcessPoolExecutor
+        bounds = numpy.linspace(0, len(sizes), workers + 1).astype(numpy.int64)
+        ranges = []
+        for a, b in zip(bounds[:-1], bounds[1:]):
+            # the range's vertices, renumbered from 0: the process gets their
+            # coordinates and maps its triangles back to the mesh's ids
+            used, local = numpy.unique(ids[offsets[a]:offsets[b]], return_inverse = True)
+            ranges.append((sizes[a:b], local.astype(numpy.int32), coords[used], used))
+        with ProcessPoolExecutor(max_workers = workers) as executor:
+            return numpy.concatenate(list(executor.map(_TriangulateRange, ranges)))
+
+    triangles = numpy.empty((len(ids) - 2 * len(sizes), 3), dtype = numpy.int32)
+    firstTriangles = offsets[:-1] - 2 * numpy.arange(len(sizes), dtype = numpy.int64)
+    for size in numpy.unique(sizes):
+        polygons = numpy.flatnonzero(sizes == size)
+        vertexIDs = ids[offsets[polygons][:, None] + numpy.arange(size)]
+        rows = firstTriangles[polygons][:, None] + numpy.arange(size - 2)
+        if size == 3:
+            triangles[rows[:, 0]] = vertexIDs
+            continue
+
+        x, y, orientation = _Projected(coords, vertexIDs)
+        previous, following = numpy.roll(numpy.arange(size), 1), numpy.roll(numpy.arange(size), -1)
+        turns = _Cross(x[:, previous], y[:, previous], x, y, x[:, following], y[:, following]) * orientation[:, None]
+        convex = (turns >= 0.0).all(axis = 1)
+
+        fans = numpy.flatnonzero(convex)
+        second = numpy.arange(1, size - 1)
+        triangles[rows[fans]] = numpy.stack([numpy.broadcast_to(vertexIDs[fans, :1], (len(fans), size - 2)),
+                                             vertexIDs[fans][:, second], vertexIDs[fans][:, second + 1]], axis = 2)
+
+        concave = numpy.flatnonzero(~convex)
+        chunk = max(1, _EAR_CLIPPING_PAIRS // (size * size))
+        for start in range(0, len(concave), chunk):
+            part = concave[start:start + chunk]
+            local = _EarClipping(x[part], y[part], orientation[part])
+            triangles[rows[part]] = numpy.take_along_axis(vertexIDs[part][:, None, :], local.reshape(len(part), 1, -1),
+                                                          axis = 2).reshape(len(part), size - 2, 3)
+    return triangles.reshape(-1)
+
+
+def _TriangulateRange(arguments) -> "numpy.ndarray":
+    """ Triangulate() of a range of polygons, in a pool process: the range's own
+        vertex ids in, the mesh's out. """
+    sizes, ids, coords, used = arguments
+    return used[Triangulate(sizes, ids, coords)].astype(numpy.int32)
@@ -0,0 +1,250 @@
+# MIT License
+#
+# Copyright (c) 2026 Rizom-Lab
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import bisect
+import threading
+import time
+
+from RizomUVLinkArrays import IsBuffer
+
+# upper bounds of the latency histogram buckets, in ms. The last bucket, past the
+# last bound, is +Inf.
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 300000)
+
+
+def PayloadBytes(value) -> int:
+    """ Estimated size of a command's parameters or result on the wire. Only the
+        lengths of the vectors are looked at, never their elements, so that the
+        estimate costs next to nothing whatever the mesh size. """
+    if isinstance(value, dict):
+        return sum(len(str(k)) + PayloadBytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return 8 * len(value)
+    if isinstance(value, str):
+        return len(value)
+    if IsBuffer(value):
+        # sent as the list of its elements, whatever their width here
+        return 8 * _Elements(value)
+    return 8
+
+
+def _Elements(buffer) -> int:
+    """ How many elements a typed buffer holds, all dimensions included. """
+    view = memoryview(buffer)
+    return view.nbytes // view.itemsize if view.itemsize else 0
+
+
+class CCommandMetrics:
+    """ What one command name accumulated. """
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.latencySum = 0.0
+        self.latencyMax = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.requestBytes = 0
+        self.responseBytes = 0
+
+
+class CLinkMetrics:
+    """ Per command counters of a link: calls, latency histogram, payload sizes,
+        timeouts and CZEx errors.
+
+        Recording is a handful of additions under a lock, cheap enough to stay on
+        in production. A failed command whose latency reached its timeout is
+        counted as a timeout, any other failure as an error.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.commands = {}
+
+    def Record(self, commandName : str, ms : float, requestBytes : int, responseBytes : int = 0,
+               failed : bool = False, timeOut : int = None):
+        with self.lock:
+            metrics = self.commands.get(commandName)
+            if metrics is None:
+                metrics = self.commands[commandName] = CCommandMetrics()
+            metrics.count += 1
+            metrics.latencySum += ms
+            if ms > metrics.latencyMax:
+                metrics.latencyMax = ms
+            metrics.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+            metrics.requestBytes += requestBytes
+            metrics.responseBytes += responseBytes
+            if failed:
+                if timeOut is not None and ms >= 0.95 * timeOut:
+                    metrics.timeouts += 1
+                else:
+                    metrics.errors += 1
+
+    def Snapshot(self) -> dict:
+        """ {command name: {count, errors, timeouts, latencyMs, requestBytes,
+            responseBytes}}, latencyMs holding sum, max, mean and the per bucket
+            counts keyed by upper bound. """
+        snapshot = {}
+        with self.lock:
+            for name, m in self.commands.items():
+                bounds = [str(b) for b in LATENCY_BUCKETS_MS] + ["+Inf"]
+                snapshot[name] = {
+                    "count": m.count, "errors": m.errors, "timeouts": m.timeouts,
+                    "latencyMs": {"sum": m.latencySum, "max": m.latencyMax,
+                                  "mean": m.latencySum / m.count if m.count else 0.0,
+                                  "buckets": dict(zip(bounds, m.buckets))},
+                    "requestBytes": m.requestBytes, "responseBytes": m.responseBytes,
+                }
+        return snapshot
+
+    def Reset(self):
+        with self.lock:
+            self.commands = {}
+
+    def PrometheusText(self, prefix : str = "rizomuvlink") -> str:
+        """ The metrics in the Prometheus text exposition format. """
+        lines = []
+
+        def header(name, kind, text):
+            lines.append("# HELP " + prefix + "_" + name + " " + text)
+            lines.append("# TYPE " + prefix + "_" + name + " " + kind)
+
+        snapshot = self.Snapshot()
+        header("command_duration_seconds", "histogram", "Link command latency")
+        for name, m in sorted(snapshot.items()):
+            cumulated = 0
+            for bound, count in m["latencyMs"]["buckets"].items():
+                cumulated += count
+                le = bound if bound == "+Inf" else repr(float(bound) / 1000.0)
+                lines.append('%s_command_duration_seconds_bucket{command="%s",le="%s"} %d' % (prefix, name, le, cumulated))
+            lines.append('%s_command_duration_seconds_sum{command="%s"} %r' % (prefix, name, m["latencyMs"]["sum"] / 1000.0))
+            lines.append('%s_command_duration_seconds_count{command="%s"} %d' % (prefix, name, m["count"]))
+        for key, metric, text in (("errors", "command_errors_total", "Link commands that failed with a CZEx"),
+                                  ("timeouts", "command_timeouts_total", "Link commands that timed out"),
+                                  ("requestBytes", "command_request_bytes_total", "Estimated bytes sent"),
+                                  ("responseBytes", "command_response_bytes_total", "Estimated bytes received")):
+            header(metric, "counter", text)
+            for name, m in sorted(snapshot.items()):
+                lines.append('%s_%s{command="%s"} %d' % (prefix, metric, name, m[key]))
+        return "\n".join(lines) + "\n"
+
+
+def ParameterSummary(parameters):
+    """ A short, printable view of a command's parameters: vectors are replaced by
+        their type and length, so that a hook can log every call of a bridge. """
+    if isinstance(parameters, dict):
+        return {k: ParameterSummary(v) for k, v in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if len(parameters) > 8:
+            return "<%s of %d>" % (type(parameters).__name__, len(parameters))
+        return parameters
+    if IsBuffer(parameters):
+        # never handed on as is: a hook keeping it would keep the mesh alive
+        return "<%s of %d>" % (type(parameters).__name__, _Elements(parameters))
+    return parameters
+
+
+class CSpan:
+    """ One timed step. start and end are time.perf_counter() values. """
+
+    def __init__(self, name : str, parent : "CSpan", attributes : dict):
+        self.name = name
+        self.parent = parent
+        self.depth = 0 if parent is None else parent.depth + 1
+        self.attributes = attributes
+        self.start = 0.0
+        self.end = None
+        self.error = None
+
+    def DurationMs(self) -> float:
+        return 0.0 if self.end is None else (self.end - self.start) * 1000.0
+
+    def Path(self) -> str:
+        """ "RunRizomUV/WaitForPort": the names of the enclosing spans and its own. """
+        return self.name if self.parent is None else self.parent.Path() + "/" + self.name
+
+
+class CSpanTracer:
+    """ Nested timings of what a link does.
+
+        Span(name) times a with block; spans opened inside it, on the same thread,
+        are its children. The link opens a span for every command, and composite
+        helpers open one for each of their steps (RunRizomUV: Spawn, WaitForPort,
+        FirstRoundTrip), so that pipeline time can be attributed step by step.
+
+        The last maxSpans finished spans are kept in spans; onSpanEnd(span), when
+        given, is called with each one as it ends, which is where a profiler or an
+        external tracing system plugs in.
+    """
+
+    def __init__(self, onSpanEnd = None, maxSpans : int = 10000):
+        from collections import deque
+        self.onSpanEnd = onSpanEnd
+        self.spans = deque(maxlen = maxSpans)
+        self.local = threading.local()
+
+    def Current(self) -> CSpan:
+        stack = getattr(self.local, "stack", None)
+        return stack[-1] if stack else None
+
+    def Span(self, name : str, **attributes):
+        tracer = self
+
+        class _Span:
+            def __enter__(self):
+                if not hasattr(tracer.local, "stack"):
+                    tracer.local.stack = []
+                self.span = CSpan(name, tracer.Current(), attributes)
+                tracer.local.stack.append(self.span)
+                self.span.start = time.perf_counter()
+                return self.span
+
+            def __exit__(self, excType, excValue, traceback):
+                self.span.end = time.perf_counter()
+                self.span.error = excValue
+                tracer.local.stack.pop()
+                tracer.spans.append(self.span)
+                if tracer.onSpanEnd is not None:
+                    tracer.onSpanEnd(self.span)
+
+        return _Span()
+
+    def Report(self) -> str:
+        """ The kept spans as an indented text tree, one line per span. """
+        lines = []
+        for span in sorted(self.spans, key = lambda s: (s.start, s.depth)):
+            lines.append("%s%s %.3f ms%s" % ("  " * span.depth, span.name, span.DurationMs(),
+                                             "" if span.error is None else " FAILED: " + str(span.error)))
+        return "\n".join(lines)
+
+
+class _NoSpan:
+    """ What a link opens when it is not traced. """
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        pass
+
+
+NO_SPAN = _NoSpan()
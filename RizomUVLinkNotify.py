@@ -0,0 +1,227 @@
+# MIT License
+#
+# Copyright (c) 2026 Rizom-Lab
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+import time
+
+from collections import OrderedDict
+
+from RizomUVLinkArrays import CZEx
+
+
+class CNotificationCoalescer:
+    """ Change notifications held back and merged before they are delivered.
+
+        A long operation fires several notifications for the same path, each one
+        an intermediate version, and a bridge pulling the data on each of them
+        pulls it several times for nothing. Here a notification waits until its
+        path has been quiet for quietMs, or until it has waited maxLatencyMs
+        (None: no limit) so that a path changing continuously is still delivered
+        from time to time. While it waits, a newer notification for the same path
+        replaces it: the latest version wins, and each path is pending at most once.
+
+        Delivery happens on a thread of its own. The thread reading the channel
+        only records notifications and never waits on a callback, so a slow
+        callback delays nothing but its own next call, and what arrives meanwhile
+        is merged instead of piling up. maxPending (0: no limit) bounds the number
+        of distinct paths pending; past it the overflow policy applies:
+        "dropOldest" forgets the path waiting the longest, "dropNewest" ignores
+        the incoming one. dropped counts the notifications lost that way.
+
+        A deliver that raises does not stop the thread: errors counts it and
+        lastError keeps the last exception.
+    """
+
+    def __init__(self, deliver, quietMs : float = 50.0, maxLatencyMs : float = None,
+                 maxPending : int = 0, overflow : str = "dropOldest"):
+        if overflow not in ("dropOldest", "dropNewest"):
+            raise CZEx("overflow must be 'dropOldest' or 'dropNewest', not '" + str(overflow) + "'")
+        self.deliver = deliver
+        self.quiet = quietMs / 1000.0
+        self.maxLatency = None if maxLatencyMs is None else maxLatencyMs / 1000.0
+        self.maxPending = maxPending
+        self.overflow = overflow
+        self.pending = OrderedDict()  # path -> [version, first seen, last seen]
+        self.condition = threading.Condition()
+        self.stopped = False
+        self.received = 0
+        self.delivered = 0
+        self.merged = 0
+        self.dropped = 0
+        self.errors = 0
+        self.lastError = None
+        self.thread = threading.Thread(target = self.Loop, daemon = True)
+        self.thread.start()
+
+    def Add(self, path : str, version):
+        now = time.monotonic()
+        with self.condition:
+            self.received += 1
+            entry = self.pending.get(path)
+            if entry is not None:
+                entry[0] = version
+                entry[2] = now
+                self.merged += 1
+            else:
+                if self.maxPending and len(self.pending) >= self.maxPending:
+                    self.dropped += 1
+                    if self.overflow == "dropNewest":
+                        return
+                    self.pending.popitem(last = False)
+                self.pending[path] = [version, now, now]
+            self.condition.notify()
+
+    def IsPending(self, path : str) -> bool:
+        """ True when a notification for path waits to be delivered: a newer
+            version than any being handled right now. """
+        with self.condition:
+            return path in self.pending
+
+    def Due(self, entry) -> float:
+        """ When the entry is to be delivered. """
+        due = entry[2] + self.quiet
+        if self.maxLatency is not None:
+            due = min(due, entry[1] + self.maxLatency)
+        return due
+
+    def Loop(self):
+        while True:
+            with self.condition:
+                while True:
+                    if self.stopped:
+                        return
+                    now = time.monotonic()
+                    ready = None
+                    wait = None
+                    for path, entry in self.pending.items():
+                        due = self.Due(entry)
+                        if due <= now:
+                            ready = path
+                            break
+                        wait = due - now if wait is None else min(wait, due - now)
+                    if ready is not None:
+                        version = self.pending.pop(ready)[0]
+                        break
+                    self.condition.wait(wait)
+            self.delivered += 1
+            try:
+                self.deliver(ready, version)
+            except Exception as ex:
+                with self.condition:
+                    self.errors += 1
+                    self.lastError = ex
+
+    def Stop(self):
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
+        if self.thread is not threading.current_thread():
+            self.thread.join(timeout = 2.0)
+
+
+class CNotificationDispatcher:
+    """ Runs notification callbacks on a pool of worker threads.
+
+        Callbacks of different paths run in parallel, on at most workers threads,
+        so a slow one no longer holds up the others. Callbacks of the same path
+        run one after the other, in the order the notifications came: a callback
+        never sees an older version after a newer one.
+
+        A callback that raises does not stop anything: errors counts it,
+        lastError keeps the last exception, and onError(path, version, exception)
+        is called when given. Stats() reports the time from the reception of a
+        notification to the start of its callback.
+    """
+
+    def __init__(self, callback, workers : int = 4, onError = None, samples : int = 1024):
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+        self.callback = callback
+        self.onError = onError
+        self.executor = ThreadPoolExecutor(max_workers = workers)
+        self.lock = threading.Lock()
+        self.queues = {}       # path -> deque of (version, received at), for the running paths
+        self.latencies = deque(maxlen = samples)
+        self.received = 0
+        self.delivered = 0
+        self.errors = 0
+        self.lastError = None
+        self.maxLatency = 0.0
+
+    def Submit(self, path : str, version, receivedAt : float = None):
+        """ Queue callback(path, version). receivedAt, a time.perf_counter() value,
+            is when the notification was received; now by default. """
+        from collections import deque
+        item = (version, time.perf_counter() if receivedAt is None else receivedAt)
+        with self.lock:
+            self.received += 1
+            queue = self.queues.get(path)
+            if queue is not None:
+                queue.append(item)  # the worker draining that path will get to it
+                return
+            self.queues[path] = deque([item])
+        self.executor.submit(self.Drain, path)
+
+    def Drain(self, path : str):
+        while True:
+            with self.lock:
+                queue = self.queues[path]
+                if not queue:
+                    del self.queues[path]
+                    return
+                version, receivedAt = queue.popleft()
+            latency = time.perf_counter() - receivedAt
+            try:
+                self.callback(path, version)
+            except Exception as ex:
+                with self.lock:
+                    self.errors += 1
+                    self.lastError = ex
+                if self.onError is not None:
+                    try:
+                        self.onError(path, version, ex)
+                    except Exception:
+                        pass
+            with self.lock:
+                self.delivered += 1
+                self.latencies.append(latency)
+                self.maxLatency = max(self.maxLatency, latency)
+
+    def Stats(self) -> dict:
+        """ Counters, and notification to callback latencies in ms over the last
+            samples notifications. """
+        with self.lock:
+            latencies = sorted(self.latencies)
+            stats = {"received": self.received, "delivered": self.delivered,
+                     "errors": self.errors, "lastError": repr(self.lastError) if self.lastError else None}
+        if latencies:
+            stats["latencyMs"] = {
+                "mean": 1000.0 * sum(latencies) / len(latencies),
+                "p50": 1000.0 * latencies[len(latencies) // 2],
+                "p99": 1000.0 * latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+                "max": 1000.0 * self.maxLatency,
+            }
+        return stats
+
+    def Stop(self, wait : bool = True):
+        """ Stop taking callbacks; with wait, let the queued ones finish first. """
+        self.executor.shutdown(wait = wait)
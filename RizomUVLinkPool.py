@@ -0,0 +1,298 @@
+# MIT License
+#
+# Copyright (c) 2026 Rizom-Lab
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import queue
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from RizomUVLink import CRizomUVLink
+from RizomUVLink import CZEx
+
+
+def UnwrapJob(link : CRizomUVLink, mesh : dict) -> dict:
+    """ The usual batch job: load the mesh (Load() parameters), unfold it, pack
+        it, and return its UVs as typed buffers (see SaveArrays). """
+    link.Load(mesh)
+    link.Unfold({})
+    link.Pack({})
+    return link.SaveArrays({"Data": True})
+
+
+class CRizomUVStandby:
+    """ RizomUV instances launched ahead of time, for a tool to start on at once.
+
+        A cold launch takes seconds. The standby keeps count instances running in
+        the background (RunRizomUV background=True), each one past its startup
+        sequence, and hands them out on demand:
+
+            standby = CRizomUVStandby(2)
+            ...
+            link = CRizomUVLink()
+            link.RunRizomUV(standby = standby)   # returns immediately
+
+        Every checkout starts a replacement in the background. An instance that
+        died while waiting is skipped. A launch that fails makes one Checkout()
+        fail in its place, lastError telling why, rather than leave it waiting for
+        an instance that is not coming. Close() quits the instances not handed out.
+
+        backend, when given, is called for the backend of each link (see
+        CRizomUVLink), CRizomUVStandInPyd to run on stand-ins for instance.
+    """
+
+    def __init__(self, count : int = 1, exePath : str = None, timeOut : float = 120.0, backend = None):
+        self.count = count
+        self.exePath = exePath
+        self.timeOut = timeOut
+        self.backend = backend
+        self.ready = queue.Queue()
+        self.closed = False
+        self.lastError = None
+        for i in range(count):
+            self.Replenish()
+
+    def Replenish(self):
+        """ Launch one more instance in the background. """
+        def launch():
+            try:
+                link = CRizomUVLink(None if self.backend is None else self.backend())
+                link.RunRizomUV(self.exePath, timeOut = self.timeOut, background = True)
+            except Exception as ex:
+                # no license left, executable gone...: wake whoever waits for it
+                self.lastError = ex
+                self.ready.put(None)
+                return
+            if self.closed:
+                link.Quit({})
+            else:
+                self.ready.put(link)
+        threading.Thread(target = launch, daemon = True).start()
+
+    def Checkout(self, timeOut : float = None) -> CRizomUVLink:
+        """ A connected, ready instance, waiting at most timeOut seconds for one
+            when none is ready yet (forever by default). """
+        deadline = None if timeOut is None else time.time() + timeOut
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.time())
+            try:
+                link = self.ready.get(timeout = remaining)
+            except queue.Empty:
+                raise CZEx("No standby RizomUV instance became ready within " + str(timeOut) + "s"
+                           + ("" if self.lastError is None else ". Last launch error: " + str(self.lastError)))
+            if link is None:
+                raise CZEx("A standby RizomUV instance failed to start: " + str(self.lastError))
+            self.Replenish()
+            if link.process is None or link.process.poll() is None:
+                return link
+
+    def Close(self):
+        self.closed = True
+        while True:
+            try:
+                link = self.ready.get_nowait()
+            except queue.Empty:
+                break
+            if link is None:
+                continue
+            try:
+                link.Quit({})
+            except CZEx:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.Close()
+
+
+class CRizomUVPool:
+    """ A set of RizomUV instances working side by side.
+
+        One instance uses a few cores at best, and the link is single client per
+        port: the way to keep a farm node busy is several instances, one link
+        each. The pool launches size instances, on the distinct ports RunRizomUV
+        draws and locks, and lends them out one job at a time:
+
+            with CRizomUVPool(8) as pool:
+                results = pool.map(UnwrapJob, meshes)
+
+        or, for hand written jobs:
+
+            with pool.Lease() as link:
+                link.Load(...)
+
+        A returned instance is recycled -- its scene emptied -- before it is lent
+        again, and restarted after recycleAfter jobs (0: never) to bound the
+        memory a long running instance accumulates. An instance found dead on
+        return is replaced; should its replacement fail to start, the pool goes
+        on with one instance less, lastError telling why, and once none is left
+        Acquire() fails instead of waiting.
+
+        standby, a CRizomUVStandby, provides the instances when given: the pool
+        then starts on instances that are already running, and so do its
+        restarts and replacements.
+
+        backend, when given, is called for the backend of each link (see
+        CRizomUVLink): with CRizomUVStandInPyd, and the path of a script starting
+        a stand-in as exePath, the pool runs on stand-ins, without RizomUV nor
+        the compiled module.
+    """
+
+    def __init__(self, size : int, exePath : str = None, background : bool = True,
+                 timeOut : float = 120.0, recycleAfter : int = 0, standby : CRizomUVStandby = None,
+                 backend = None):
+        if size < 1:
+            raise CZEx("A pool needs at least one instance")
+        self.size = size
+        self.exePath = exePath
+        self.backend = backend
+        self.background = background
+        self.timeOut = timeOut
+        self.recycleAfter = recycleAfter
+        self.standby = standby
+        self.idle = queue.Queue()
+        self.links = []
+        self.jobCounts = {}
+        self.linksLock = threading.Lock()
+        self.alive = size         # instances idle or leased
+        self.lastError = None     # why the last replacement failed to start
+
+        # launched in parallel: a cold start takes seconds, N of them in a row would
+        # take N times that
+        try:
+            with ThreadPoolExecutor(max_workers = size) as launcher:
+                for link in launcher.map(lambda i: self.Launch(), range(size)):
+                    self.idle.put(link)
+        except BaseException:
+            # whatever failed (a CZEx, Popen's OSError, an interrupt...), do not
+            # leave the instances that did start behind
+            self.Close()
+            raise
+
+    def Launch(self) -> CRizomUVLink:
+        # no port given: RunRizomUV draws a free one and locks it, which keeps the
+        # parallel launches of the pool -- and those of other processes -- apart
+        link = CRizomUVLink(None if self.backend is None else self.backend())
+        link.RunRizomUV(self.exePath, timeOut = self.timeOut, background = self.background, standby = self.standby)
+        with self.linksLock:
+            self.links.append(link)
+        self.jobCounts[link.port] = 0
+        return link
+
+    def Retire(self, link : CRizomUVLink):
+        """ Quit an instance, or forget it if it is already gone. """
+        try:
+            link.Quit({})
+        except CZEx:
+            pass
+        with self.linksLock:
+            if link in self.links:
+                self.links.remove(link)
+        self.jobCounts.pop(link.port, None)
+
+    def Acquire(self, timeOut : float = None) -> CRizomUVLink:
+        """ Take an instance out of the pool, waiting at most timeOut seconds
+            (forever by default) for one to be returned. Fails at once when the
+            pool has no instance left. """
+        try:
+            link = self.idle.get(timeout = timeOut)
+        except queue.Empty:
+            raise CZEx("No RizomUV instance of the pool became available within " + str(timeOut) + "s")
+        if link is None:
+            self.idle.put(None)  # wakes the next one waiting, which fails the same way
+            raise CZEx("No RizomUV instance left in the pool"
+                       + ("" if self.lastError is None else ": the last one failed to restart, " + str(self.lastError)))
+        return link
+
+    def Return(self, link : CRizomUVLink):
+        """ Give an instance back: recycled, restarted or replaced as needed.
+            Never raises: an instance that cannot be replaced shrinks the pool. """
+        self.jobCounts[link.port] = self.jobCounts.get(link.port, 0) + 1
+        try:
+            if self.recycleAfter and self.jobCounts[link.port] >= self.recycleAfter:
+                link = self.Replace(link)
+            else:
+                link.Load({"DefaultEmptyScene": True})
+        except CZEx:
+            # the instance died on the job or will not reset: start another
+            link = self.Replace(link)
+        if link is not None:
+            self.idle.put(link)
+
+    def Replace(self, link : CRizomUVLink) -> CRizomUVLink:
+        """ Quit link and launch another, None when that one fails to start. """
+        self.Retire(link)
+        try:
+            return self.Launch()
+        except Exception as ex:
+            # no license left, executable gone...: go on with one instance less
+            with self.linksLock:
+                self.lastError = ex
+                self.alive -= 1
+                empty = self.alive == 0
+            if empty:
+                self.idle.put(None)  # nobody will return anything: fail the waiters
+            return None
+
+    def Lease(self, timeOut : float = None):
+        """ with pool.Lease() as link: ... -- Acquire() then Return(). """
+        pool = self
+
+        class _Lease:
+            def __enter__(self):
+                self.link = pool.Acquire(timeOut)
+                return self.link
+
+            def __exit__(self, *exc):
+                pool.Return(self.link)
+
+        return _Lease()
+
+    def map(self, job, meshes) -> list:
+        """ Run job(link, mesh) for every mesh, spread over all the instances, and
+            return the results in the order of meshes. The first exception raised
+            by a job is raised here, once every job has finished. """
+        def run(mesh):
+            with self.Lease() as link:
+                return job(link, mesh)
+
+        with ThreadPoolExecutor(max_workers = self.size) as workers:
+            futures = [workers.submit(run, mesh) for mesh in meshes]
+        return [future.result() for future in futures]
+
+    def Close(self):
+        """ Quit every instance. The ones currently leased are quit as well. """
+        while True:
+            try:
+                self.idle.get_nowait()
+            except queue.Empty:
+                break
+        for link in list(self.links):
+            self.Retire(link)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.Close()
@@ -0,0 +1,267 @@
+# MIT License
+#
+# Copyright (c) 2026 Rizom-Lab
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Client side parameter checks.
+#
+# The help text of every command describes its parameters in PARAMETER blocks:
+#
+#     PARAMETER       : Strategy
+#     Brief           : Defines the strategy used for UV packing...
+#     Type            : string
+#     Default         : "Efficient"
+#     Possible Values :
+#                      - "Efficient"        : Focuses on fast computation
+#                      - "PaddingPerfect"   : ...
+#
+# ParseParameters() turns those into a schema, RizomUVLinkGen writes the schemas
+# of all commands to RizomUVLinkBaseSchemas.json along with the header of the
+# RizomUVLinkBase.py they were parsed from, and CParameterValidator checks
+# a command's parameters against its schema before anything is sent: a misspelled
+# key or a value outside the possible ones fails at once, instead of after a round
+# trip that may already have changed the scene.
+
+import json
+import numbers
+import os
+import re
+
+from RizomUVLinkArrays import CZEx
+from RizomUVLinkArrays import IsBuffer
+from RizomUVLinkArrays import IsScalarBuffer
+from RizomUVLinkArrays import ScalarValue
+
+SCHEMA_FILE = "RizomUVLinkBaseSchemas.json"
+
+# parameter types whose values are checked, and the Python types they take
+SCALAR_TYPES = {
+    "bool": (bool, numbers.Integral),
+    "int": (numbers.Integral,),
+    "double": (numbers.Real,),
+    "string": (str,),
+}
+# parameter types taking a vector: a list, a tuple or any buffer (see IsBuffer).
+# Their elements are not looked at: that would cost as much as the transfer.
+VECTOR_TYPES = ("ints", "doubles", "strings", "vector2d", "vector3d", "box2d", "matrix3d")
+
+_PARAMETER = re.compile(r"PARAMETER\s*:\s*(\S+)")
+_BRIEF = re.compile(r"Brief\s*:")
+_FIELD = re.compile(r"(Type|Default)\s*:\s*(.*)")
+_VALUES = re.compile(r"Possible Values\s*:")
+_REFERENCE = re.compile(r"##([A-Za-z][\w.]*)##")
+
+
+def _Unquote(text : str) -> str:
+    text = text.strip()
+    if len(text) >= 2 and text[0] == text[-1] == '"':
+        return text[1:-1]
+    return text
+
+
+def ParseParameters(helpText : str) -> dict:
+    """ {parameter name: {"Type", "Default", "Values"}} from the PARAMETER blocks
+        of a command's help text. Type is reduced to its first word ("table
+        (DataMap)" is a "table"), and is "" when unknown; Default is None when
+        not given, and Values the list of possible values, None when the
+        parameter does not list any. """
+    parameters = {}
+    current = None
+    inValues = False
+    for line in (helpText or "").splitlines():
+        line = line.strip()
+        match = _PARAMETER.match(line)
+        if match:
+            current = parameters[match.group(1)] = {"Type": "", "Default": None, "Values": None}
+            inValues = False
+            brief = False
+            continue
+        if current is None:
+            continue
+        if _BRIEF.match(line):
+            if brief:
+                # a second Brief: a block of its own (an enum, return codes...) that
+                # does not belong to the parameter above
+                current = None
+                continue
+            brief = True
+        if inValues:
+            if line.startswith("- "):
+                current["Values"].append(_Unquote(line[2:].split(":", 1)[0]))
+                continue
+            if line:
+                inValues = False
+        match = _FIELD.match(line)
+        if match:
+            if match.group(1) == "Type":
+                current["Type"] = match.group(2).split(" ", 1)[0]
+            else:
+                current["Default"] = _Unquote(match.group(2))
+        elif _VALUES.match(line):
+            current["Values"] = []
+            inValues = True
+
+    # names the text refers to as ##Name## without a PARAMETER block of their own
+    # (Pack's Global...): known, but of unknown type and content
+    for name in _REFERENCE.findall(helpText or ""):
+        parameters.setdefault(name, {"Type": "", "Default": None, "Values": None})
+    return parameters
+
+
+def SchemasFromClass(cls) -> dict:
+    """ {command name: schema} parsed from the help text of the methods of cls,
+        for the commands that document parameters. """
+    schemas = {}
+    for name in dir(cls):
+        if name.startswith("_"):
+            continue
+        schema = ParseParameters(getattr(getattr(cls, name), "__doc__", None))
+        if schema:
+            schemas[name] = schema
+    return schemas
+
+
+def GeneratedFrom(basePath : str) -> str:
+    """ The header of a generated RizomUVLinkBase.py, its first two lines naming
+        the RizomUV build it came from; None when there is no such file. """
+    try:
+        with open(basePath, encoding = "utf-8") as f:
+            return f.readline() + f.readline()
+    except OSError:
+        return None
+
+
+def LoadSchemas(cls) -> dict:
+    """ The schemas written by RizomUVLinkGen next to this module, or those of
+        cls's help text when there are none, or when they were written from
+        another RizomUVLinkBase.py than the one next to them: a stale file would
+        reject the parameters a newer RizomUV added. """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    try:
+        with open(os.path.join(directory, SCHEMA_FILE), encoding = "utf-8") as f:
+            written = json.load(f)
+    except (OSError, ValueError):
+        return SchemasFromClass(cls)
+    generatedFrom = GeneratedFrom(os.path.join(directory, "RizomUVLinkBase.py"))
+    if not isinstance(written, dict) or "Schemas" not in written \
+            or generatedFrom not in (None, written.get("GeneratedFrom")):
+        return SchemasFromClass(cls)
+    return written["Schemas"]
+
+
+def StringValues(parameter : dict) -> set:
+    """ The possible values of a string parameter. The default counts: it may
+        combine values not listed, like "Visible&UnLocked". """
+    values = set(parameter.get("Values") or ())
+    if values and parameter.get("Default"):
+        values.update(parameter["Default"].split("&"))
+    return values
+
+
+class CCommandSchema:
+    """ The schema of one command, compiled for checking: a dict lookup and an
+        isinstance() per parameter. """
+
+    def __init__(self, commandName : str, schema : dict, extraKeys = (), sharedValues : dict = {}):
+        self.commandName = commandName
+        self.checks = {}        # name -> (Python types or None, vector, possible values or None, type)
+        self.tables = set()     # table or untyped parameters: anything below them goes
+        for name, parameter in schema.items():
+            kind = parameter.get("Type", "")
+            values = None
+            if kind == "string" and parameter.get("Values"):
+                values = frozenset(sharedValues.get(name, ()) or StringValues(parameter))
+            elif kind == "int" and parameter.get("Values") and all(v.lstrip("-").isdigit() for v in parameter["Values"]):
+                values = frozenset(int(v) for v in parameter["Values"])
+            if kind in ("table", ""):
+                self.tables.add(name)
+            self.checks[name] = (SCALAR_TYPES.get(kind), kind in VECTOR_TYPES, values, kind)
+        for name in extraKeys:
+            self.checks.setdefault(name, (None, False, None, ""))
+
+    def UnderTable(self, name : str) -> bool:
+        while "." in name:
+            name = name.rsplit(".", 1)[0]
+            if name in self.tables:
+                return True
+        return False
+
+    def Fail(self, text : str):
+        raise CZEx(self.commandName + ": " + text)
+
+    def Validate(self, parameters, prefix : str = ""):
+        """ Raise a CZEx on the first parameter the schema does not allow.
+            Nested tables are checked as the dotted names they stand for. """
+        for key, value in parameters.items():
+            name = prefix + key
+            check = self.checks.get(name)
+            if check is None:
+                if key.startswith("__"):
+                    continue  # internal switches ("__Focus"...), never documented
+                if isinstance(value, dict):
+                    self.Validate(value, name + ".")
+                elif not self.UnderTable(name):
+                    import difflib
+                    close = difflib.get_close_matches(name, list(self.checks), 1)
+                    self.Fail("unknown parameter '" + name + "'" + (", did you mean '" + close[0] + "'?" if close else ""))
+                continue
+
+            types, vector, values, kind = check
+            if IsScalarBuffer(value):
+                value = ScalarValue(value)  # numpy.int64(5) is the int 5 once marshalled
+            if types is not None:
+                if not isinstance(value, types):
+                    self.Fail("parameter '" + name + "' must be " + kind + ", not " + type(value).__name__)
+                if values is not None and not all(v in values for v in (value.split("&") if isinstance(value, str) else (value,))):
+                    self.Fail(repr(value) + " is not a possible value of '" + name + "': "
+                              + ", ".join(sorted(str(v) for v in values)))
+            elif vector and not (isinstance(value, (list, tuple, dict)) or IsBuffer(value)):
+                self.Fail("parameter '" + name + "' must be a list of " + kind + ", not " + type(value).__name__)
+
+
+class CParameterValidator:
+    """ Checks command parameters against the schemas, each command's schema being
+        compiled the first time the command is checked. Commands without a schema,
+        and parameters that are not a dict (Get's path...), pass unchecked.
+        extraKeys are accepted by every command: keys the link itself adds. """
+
+    def __init__(self, schemas : dict, extraKeys = ()):
+        self.schemas = schemas
+        self.extraKeys = tuple(extraKeys)
+        self.compiled = {}
+        # a parameter of the same name means the same thing in every command
+        # (WorkingSet, PrimType...), but each help text lists only some of its
+        # values: any of them is accepted everywhere
+        self.sharedValues = {}
+        for schema in schemas.values():
+            for name, parameter in schema.items():
+                if parameter.get("Type") == "string" and parameter.get("Values"):
+                    self.sharedValues.setdefault(name, set()).update(StringValues(parameter))
+
+    def Validate(self, commandName : str, parameters):
+        if not isinstance(parameters, dict):
+            return
+        compiled = self.compiled.get(commandName)
+        if compiled is None:
+            schema = self.schemas.get(commandName)
+            if schema is None:
+                return
+            compiled = self.compiled[commandName] = CCommandSchema(commandName, schema, self.extraKeys, self.sharedValues)
+        compiled.Validate(parameters)
@@ -0,0 +1,146 @@
+# MIT License
+#
+# Copyright (c) 2026 Rizom-Lab
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Shared memory mesh transport.
+#
+# Client and RizomUV run on the same machine, so a mesh does not have to travel
+# through the socket: the sender writes its vectors into a memory mapped file and
+# the command only carries a handle to it,
+#
+#   {"Path": "<segment file>", "Size": <bytes>,
+#    "Layout": [[<parameter name>, <format>, <byte offset>, <element count>], ...]}
+#
+# where <format> is the memoryview format of the elements ("d" for doubles, "i" or
+# "q" for indices...). The segment lives in /dev/shm where there is one (a RAM file
+# system, nothing ever reaches a disk) and in the temporary directory otherwise. A
+# segment is unlinked by whoever asked for the transfer, once the command returned:
+# the client for Load, and again the client for the reply of Save, which the
+# instance writes into a segment it creates and hands back.
+
+import mmap
+import os
+import struct
+import tempfile
+import uuid
+
+from RizomUVLinkArrays import BufferView
+from RizomUVLinkArrays import CZEx
+from RizomUVLinkArrays import DOUBLE_OUTPUTS
+from RizomUVLinkArrays import IsBuffer
+
+# the parameter carrying the handle, in both directions
+HANDLE_KEY = "SharedMemory"
+
+# offsets are kept aligned so that every block can be viewed in place
+ALIGNMENT = 8
+
+
+def SegmentDirectory() -> str:
+    if os.path.isdir("/dev/shm"):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
+def WriteSegment(blocks : dict) -> dict:
+    """ Write the given {parameter name: buffer or list} into a new segment and
+        return its handle. Lists are accepted for convenience, and written as the
+        parameter takes them: doubles for coordinates (Data.CoordsXYZ, ...UVWs,
+        see DOUBLE_OUTPUTS), int32 indices otherwise. """
+    import array
+
+    views = []
+    offset = 0
+    for key, value in blocks.items():
+        if IsBuffer(value):
+            view = BufferView(value)
+        else:
+            # [0, 1, 2] may be coordinates: the values do not tell, the name does
+            double = key.rsplit(".", 1)[-1] in DOUBLE_OUTPUTS
+            view = memoryview(array.array("d" if double else "i", value))
+        views.append((key, view, offset))
+        offset += view.nbytes
+        offset += -offset % ALIGNMENT
+
+    path = os.path.join(SegmentDirectory(), "rizomuvlink_%d_%s.shm" % (os.getpid(), uuid.uuid4().hex))
+    size = max(offset, 1)  # an empty mapping is not allowed
+    with open(path, "w+b") as f:
+        f.truncate(size)
+        with mmap.mmap(f.fileno(), size) as mapped:
+            for key, view, start in views:
+                mapped[start:start + view.nbytes] = view.cast("B")
+
+    return {"Path": path, "Size": size,
+            "Layout": [[key, view.format, start, len(view)] for key, view, start in views]}
+
+
+def ReadSegment(handle : dict, useNumpy : bool = None) -> dict:
+    """ Read back every block of a segment as {parameter name: typed buffer}. The
+        blocks are copied out of the segment (one memcpy each), so that it can be
+        unlinked right away. useNumpy follows the same rule as ToArray. """
+    numpy = None
+    if useNumpy is None or useNumpy:
+        try:
+            import numpy
+        except ImportError:
+            if useNumpy:
+                raise CZEx("NumPy was asked for but is not installed in this Python")
+
+    import array
+    blocks = {}
+    try:
+        f = open(handle["Path"], "rb")
+    except OSError as ex:
+        raise CZEx("Shared memory segment " + str(handle.get("Path")) + " cannot be opened: " + str(ex))
+    with f:
+        with mmap.mmap(f.fileno(), handle["Size"], access = mmap.ACCESS_READ) as mapped, memoryview(mapped) as whole:
+            for key, fmt, start, count in handle["Layout"]:
+                raw = whole[start:start + count * struct.calcsize(fmt)]
+                if numpy is not None:
+                    blocks[key] = numpy.frombuffer(raw, dtype = fmt).copy()
+                else:
+                    block = array.array(fmt)
+                    block.frombytes(raw)
+                    blocks[key] = block
+                raw.release()  # or the mapping could not be closed
+    return blocks
+
+
+def ReleaseSegment(handle : dict):
+    """ Unlink a segment. Missing segments are fine: releasing twice is harmless. """
+    try:
+        os.remove(handle["Path"])
+    except OSError:
+        pass
+
+
+def SplitBlocks(parameters : dict):
+    """ Split Load() parameters in two: the vectors to transfer through a segment
+        (top level Data.* buffers and lists) and what remains to be sent on the
+        command channel. """
+    blocks = {}
+    remaining = {}
+    for key, value in parameters.items():
+        if key.startswith("Data.") and (IsBuffer(value) or isinstance(value, list)):
+            blocks[key] = value
+        else:
+            remaining[key] = value
+    return blocks, remaining
@@ -0,0 +1,587 @@
+# MIT License
+#
+# Copyright (c) 2026 Rizom-Lab
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# A pure Python stand-in for a RizomUV instance.
+#
+# It answers the link commands a bridge relies on from an in-memory data tree, so
+# that transports and helpers can be exercised and measured without a licensed
+# RizomUV: Get, Set, GetVersion, ItemNames, Count, Subscribe, Load and Save(Data),
+# plus Batch. Subscribe opens a notification channel on port + 1, fed after each
+# command like RizomUV does after each task. It is not RizomUV: no unfolding, no
+# packing, and only the commands and data tree paths implemented below.
+#
+# Run one with:
+#
+#     python RizomUVLinkStandIn.py --port 50000
+#
+# --latency and --jitter (ms) delay every reply, to load-test pools, caches and
+# listeners against something slower than a loopback; --heartbeat sets the
+# period of the heart beats sent while a command runs.
+#
+# and talk to it with a CRizomUVStandInPyd, which has the same methods as the
+# compiled RizomUVLinkPyd object. Give it to a CRizomUVLink in place of the
+# compiled one to drive the stand-in, on any platform: the compiled module is not
+# needed then.
+#
+#     link = CRizomUVLink(rizomuv = CRizomUVStandInPyd())
+#     link.Connect(50000)
+#
+# The stand-in also takes RizomUV's -id <port>, so that RunRizomUV, and the pools
+# built on it (CRizomUVPool(..., backend = CRizomUVStandInPyd)), can launch it
+# through an executable wrapper running "python RizomUVLinkStandIn.py -id <port>".
+#
+# Messages are exchanged with multiprocessing.connection, authenticated with a key
+# both sides know, on the loopback interface only. They are not the messages of
+# the compiled module, whose protocol is not public: the stand-in mirrors the
+# behaviour of the channels (one request, one reply, heart beats while waiting;
+# [path, version] pushed to every subscriber), not their bytes.
+
+import array
+import random
+import socket
+import threading
+import time
+
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener
+
+from RizomUVLinkArrays import CZEx
+from RizomUVLinkSharedMemory import HANDLE_KEY
+from RizomUVLinkSharedMemory import ReadSegment
+from RizomUVLinkSharedMemory import WriteSegment
+
+STANDIN_VERSION = "2026.0.0-standin"
+AUTH_KEY = b"rizomuvlink-standin"
+
+# the Data.* vectors of Load, and where the stand-in keeps them under Lib.Mesh
+MESH_VECTORS = {
+    "Data.PolySizes": ("PolySizes", "i"),
+    "Data.PolyXYZIDs": ("PolyXYZIDs", "i"),
+    "Data.CoordsXYZ": ("XYZ", "d"),
+    "Data.PolyUVWIDs": ("PolyUVWIDs", "i"),
+    "Data.CoordsUVW": ("UVW", "d"),
+    "Data.TriangleXYZID": ("TriangleXYZID", "i"),
+}
+
+
+def _NoDelay(conn):
+    """ Send small messages at once: a connection sends a message header and its
+        body separately, and Nagle's algorithm would hold the body back until
+        the header is acknowledged, some 40 ms later. """
+    try:
+        s = socket.fromfd(conn.fileno(), socket.AF_INET, socket.SOCK_STREAM)
+    except OSError:
+        return
+    try:
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    finally:
+        s.close()
+
+
+def _Client(address : tuple, authKey : bytes, timeOut : float):
+    """ multiprocessing.connection.Client(), the connection and the handshake
+        bounded by timeOut seconds. The stand-in serves one client at a time
+        and only authenticates the next once the current one is gone: Client()
+        would wait for that without limit. """
+    from multiprocessing import connection
+    with socket.create_connection(address, timeout = timeOut) as s:
+        s.setblocking(True)
+        conn = connection.Connection(s.detach())
+    try:
+        # the server speaks first: once its challenge is in, the rest is prompt
+        if not conn.poll(timeOut):
+            raise CZEx("Cannot connect to " + str(address) + ": the instance did not answer within "
+                       + str(timeOut) + "s, busy with another client?")
+        connection.answer_challenge(conn, authKey)
+        connection.deliver_challenge(conn, authKey)
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+def _Parent(path : str) -> str:
+    return path.rsplit(".", 1)[0] if "." in path else ""
+
+
+def _Native(value):
+    """ What the compiled module would hand back: lists and dicts, never buffers. """
+    if isinstance(value, array.array):
+        return value.tolist()
+    if isinstance(value, dict):
+        return {k: _Native(v) for k, v in value.items()}
+    return value
+
+
+class CRizomUVStandIn:
+    """ In-memory RizomUV instance answering link commands on one TCP port.
+
+        Single client per port, like the real instance: connections are served one
+        after the other, never at the same time.
+
+        latencyMs, plus a uniform random jitterMs, delays every reply;
+        commandLatencyMs ({command name: ms}) overrides latencyMs per command. While
+        a command runs, a heart beat is sent every heartBeatMs (0: none), which is
+        how a client tells a long command from a dead instance.
+
+        Every node has a version: the value of a clock ticking at each write, taken
+        by the nodes written. GetVersion of a path is the latest version of the path
+        and of its ancestors (a Load replaces the whole Lib.Mesh), and with
+        Recursive of its descendants too. A Set of the value already there writes
+        nothing.
+    """
+
+    def __init__(self, port : int, authKey : bytes = AUTH_KEY, latencyMs : float = 0.0, jitterMs : float = 0.0,
+                 commandLatencyMs : dict = None, heartBeatMs : float = 500.0):
+        self.port = port
+        self.authKey = authKey
+        self.latencyMs = latencyMs
+        self.jitterMs = jitterMs
+        self.commandLatencyMs = dict(commandLatencyMs or {})
+        self.heartBeatMs = heartBeatMs
+        self.listener = None
+        self.thread = None
+        self.running = False
+        self.tree = {
+            "Vars": {"Infos": {"Version": {"Full": STANDIN_VERSION},
+                               "Link": {HANDLE_KEY: True, "Batch": True}},
+                     "WindowManager": {"Visibility": {"Log": True}}},
+            "Lib": {"Mesh": {}},
+        }
+        self.clock = 0
+        self.versions = {}        # path -> clock value of its last write
+        self.subscribed = []      # paths watched by Subscribe
+        self.published = {}       # path -> version last notified
+        self.notifyListener = None
+        self.subscribers = []
+        self.subscribersLock = threading.Lock()
+
+    def Start(self) -> "CRizomUVStandIn":
+        """ Open the port and serve on a background daemon thread. """
+        self.listener = Listener(("127.0.0.1", self.port), authkey = self.authKey)
+        self.running = True
+        self.thread = threading.Thread(target = self.Serve, daemon = True)
+        self.thread.start()
+        return self
+
+    def Stop(self):
+        self.running = False
+        if self.listener is not None:
+            self.listener.close()
+        self.CloseNotifications()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout = 2.0)
+
+    def Serve(self):
+        if self.listener is None:
+            self.listener = Listener(("127.0.0.1", self.port), authkey = self.authKey)
+            self.running = True
+        while self.running:
+            try:
+                conn = self.listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                # closed by Stop(), or a client that failed the authentication
+                continue
+            with conn:
+                _NoDelay(conn)
+                self.ServeClient(conn)
+        self.CloseNotifications()
+
+    def ServeClient(self, conn):
+        while self.running:
+            try:
+                commandName, parameters = conn.recv()
+            except (EOFError, OSError):
+                return
+            try:
+                if self.heartBeatMs > 0:
+                    reply = self.RunBeating(conn, commandName, parameters)
+                else:
+                    reply = self.Run(commandName, parameters)
+                conn.send(reply)
+            except OSError:
+                return
+            finally:
+                self.Publish()
+            if commandName in ("Quit", "Exit"):
+                self.running = False
+                self.listener.close()
+
+    def Run(self, commandName : str, parameters) -> tuple:
+        """ The reply to one command, after the injected latency. """
+        delay = self.commandLatencyMs.get(commandName, self.latencyMs)
+        if self.jitterMs > 0:
+            delay += random.uniform(0.0, self.jitterMs)
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+        try:
+            return ("Result", _Native(self.Dispatch(commandName, parameters)))
+        except CZEx as ex:
+            return ("Error", str(ex))
+        except Exception as ex:
+            return ("Error", commandName + " failed: " + repr(ex))
+
+    def RunBeating(self, conn, commandName : str, parameters) -> tuple:
+        """ Run() on a worker thread, sending heart beats until it is done. """
+        reply = []
+        worker = threading.Thread(target = lambda: reply.append(self.Run(commandName, parameters)), daemon = True)
+        worker.start()
+        worker.join(self.heartBeatMs / 1000.0)
+        while worker.is_alive():
+            conn.send(("HeartBeat", None))
+            worker.join(self.heartBeatMs / 1000.0)
+        return reply[0]
+
+    def Dispatch(self, commandName : str, parameters):
+        command = getattr(self, "Command" + commandName, None)
+        if command is None:
+            raise CZEx("Command " + commandName + " is not implemented by the stand-in")
+        return command(parameters)
+
+    # # # data tree # # #
+
+    def Node(self, path : str):
+        node = self.tree
+        for name in path.split(".") if path else []:
+            if not isinstance(node, dict) or name not in node:
+                raise CZEx("Path not found: " + path)
+            node = node[name]
+        return node
+
+    def Touch(self, path : str):
+        """ Record a write of the node at path. """
+        self.clock += 1
+        self.versions[path] = self.clock
+
+    def Version(self, path : str, recursive : bool = False) -> int:
+        version = 0
+        node = path
+        while True:
+            version = max(version, self.versions.get(node, 0))
+            if not node:
+                break
+            node = _Parent(node)
+        if recursive:
+            prefix = path + "." if path else ""
+            for written, v in self.versions.items():
+                if written.startswith(prefix):
+                    version = max(version, v)
+        return version
+
+    # # # notifications # # #
+
+    def OpenNotifications(self):
+        if self.notifyListener is not None:
+            return
+        self.notifyListener = Listener(("127.0.0.1", self.port + 1), authkey = self.authKey)
+
+        def accept():
+            listener = self.notifyListener
+            while self.running and listener is self.notifyListener:
+                try:
+                    conn = listener.accept()
+                except (OSError, EOFError, AuthenticationError):
+                    continue
+                _NoDelay(conn)
+                with self.subscribersLock:
+                    self.subscribers.append(conn)
+        threading.Thread(target = accept, daemon = True).start()
+
+    def CloseNotifications(self):
+        listener, self.notifyListener = self.notifyListener, None
+        if listener is not None:
+            listener.close()
+        with self.subscribersLock:
+            for conn in self.subscribers:
+                conn.close()
+            self.subscribers = []
+
+    def Publish(self):
+        """ After each command, [path, version] to every subscriber for each
+            watched path that changed, like RizomUV after each task. """
+        for path in self.subscribed:
+            version = self.Version(path, recursive = True)
+            if self.published.get(path) == version:
+                continue
+            self.published[path] = version
+            with self.subscribersLock:
+                for conn in list(self.subscribers):
+                    try:
+                        conn.send([path, version])
+                    except OSError:
+                        # a subscriber gone: publishing never blocks on it
+                        self.subscribers.remove(conn)
+                        conn.close()
+
+    # # # commands # # #
+
+    def CommandGet(self, path):
+        return self.Node(path)
+
+    def CommandSet(self, parameters : dict):
+        if not isinstance(parameters, dict) or "Path" not in parameters or "Value" not in parameters:
+            raise CZEx('Set takes {"Path": <path>, "Value": <value>}')
+        path = parameters["Path"]
+        parent = self.Node(_Parent(path))
+        if not isinstance(parent, dict):
+            raise CZEx("Path not found: " + path)
+        name = path.rsplit(".", 1)[-1]
+        value = parameters["Value"]
+        if name in parent and _Native(parent[name]) == value:
+            return None
+        parent[name] = value
+        self.Touch(path)
+        return None
+
+    def CommandGetVersion(self, parameters):
+        if isinstance(parameters, dict):
+            path, recursive = parameters.get("Path", ""), bool(parameters.get("Recursive"))
+        else:
+            path, recursive = parameters, False
+        self.Node(path)
+        return self.Version(path, recursive)
+
+    def CommandItemNames(self, path):
+        node = self.Node(path)
+        return list(node.keys()) if isinstance(node, dict) else []
+
+    def CommandCount(self, path):
+        node = self.Node(path)
+        return len(node) if isinstance(node, dict) else 0
+
+    def CommandSubscribe(self, parameters):
+        paths = parameters.get("Paths", []) if isinstance(parameters, dict) else []
+        self.subscribed = list(paths)
+        # only the changes made from now on are notified
+        self.published = {path: self.Version(path, recursive = True) for path in self.subscribed}
+        if self.subscribed:
+            self.OpenNotifications()
+        return self.port + 1
+
+    def CommandLoad(self, parameters : dict):
+        mesh = {}
+        if parameters.get("DefaultEmptyScene"):
+            self.tree["Lib"]["Mesh"] = mesh
+            self.Touch("Lib.Mesh")
+            return None
+
+        if "File.Path" in parameters:
+            raise CZEx("Load of a File.Path is not implemented by the stand-in, only Data.* vectors are")
+        vectors = dict(parameters)
+        handle = vectors.pop(HANDLE_KEY, None)
+        if handle is not None:
+            vectors.update(ReadSegment(handle, useNumpy = False))
+        if "Data.CoordsUVWPartial" in vectors:
+            return self.LoadPartialUVWs(vectors["Data.CoordsUVWPartial"])
+        if "Data.CoordsUVW" in vectors and "Data.PolySizes" not in vectors:
+            return self.LoadUVWs(vectors["Data.CoordsUVW"])
+
+        for key, (name, typecode) in MESH_VECTORS.items():
+            if key in vectors:
+                value = vectors[key]
+                mesh[name] = value if isinstance(value, array.array) and value.typecode == typecode else array.array(typecode, value)
+        if "PolySizes" not in mesh or "PolyXYZIDs" not in mesh or "XYZ" not in mesh:
+            raise CZEx("IMPORT_TASK_MISFORMED_POLYGON_LISTS")
+        if sum(mesh["PolySizes"]) != len(mesh["PolyXYZIDs"]):
+            raise CZEx("IMPORT_TASK_MISFORMED_POLYGON_LISTS")
+        if "UVW" not in mesh:
+            # like RizomUV without UVs: the 3D space stands for the UVW one
+            mesh["PolyUVWIDs"] = array.array("i", mesh["PolyXYZIDs"])
+            mesh["UVW"] = array.array("d", mesh["XYZ"])
+        elif "PolyUVWIDs" not in mesh:
+            mesh["PolyUVWIDs"] = array.array("i", mesh["PolyXYZIDs"])
+        self.tree["Lib"]["Mesh"] = mesh
+        self.Touch("Lib.Mesh")
+        return None
+
+    def LoadUVWs(self, values):
+        """ Data.CoordsUVW alone: new coordinates for every UVW vertex of the mesh
+            loaded, topology unchanged. """
+        uvws = self.tree["Lib"]["Mesh"].get("UVW")
+        if uvws is None:
+            raise CZEx("IMPORT_TASK_INVALID_PARAMETER: no mesh loaded to update")
+        if len(values) != len(uvws):
+            raise CZEx("IMPORT_TASK_INVALID_PARAMETER: " + str(len(uvws)) + " UVWs values expected, got " + str(len(values)))
+        self.tree["Lib"]["Mesh"]["UVW"] = array.array("d", values)
+        self.Touch("Lib.Mesh.UVW")
+        return None
+
+    def LoadPartialUVWs(self, partial : dict):
+        """ Data.CoordsUVWPartial: new coordinates for some UVW vertices only,
+            each given by a polygon vertex using it, a (polygon, corner) pair:
+            the vertex at 2p in PolyVertIDs has its coordinates at 3p in UVWs. """
+        mesh = self.tree["Lib"]["Mesh"]
+        uvws = mesh.get("UVW")
+        if uvws is None:
+            raise CZEx("IMPORT_TASK_INVALID_PARAMETER: no mesh loaded to update")
+        polyVerts = partial.get("PolyVertIDs", [])
+        values = partial.get("UVWs", [])
+        if len(polyVerts) % 2 != 0:
+            raise CZEx("IMPORT_TASK_INVALID_PARAMETER: PolyVertIDs holds (polygon, vertex) pairs, got an odd count")
+        if len(values) != 3 * (len(polyVerts) // 2):
+            raise CZEx("IMPORT_TASK_INVALID_PARAMETER: 3 UVWs values per (polygon, vertex) pair expected")
+        sizes = mesh["PolySizes"]
+        offsets = [0]
+        for size in sizes:
+            offsets.append(offsets[-1] + size)
+        for i in range(len(polyVerts) // 2):
+            polygon, corner = polyVerts[2 * i], polyVerts[2 * i + 1]
+            if not 0 <= polygon < len(sizes) or not 0 <= corner < sizes[polygon]:
+                raise CZEx("IMPORT_TASK_INVALID_PARAMETER: no polygon vertex (" + str(polygon) + ", " + str(corner) + ")")
+            id = mesh["PolyUVWIDs"][offsets[polygon] + corner]
+            uvws[3 * id:3 * id + 3] = array.array("d", values[3 * i:3 * i + 3])
+        if len(polyVerts):
+            self.Touch("Lib.Mesh.UVW")
+        return None
+
+    def CommandSave(self, parameters : dict):
+        mesh = self.tree["Lib"]["Mesh"]
+        if not mesh:
+            raise CZEx("EXPORT_TASK_INVALID_PARAMETER: no mesh loaded")
+        if not parameters.get("Data"):
+            raise CZEx("EXPORT_TASK_INVALID_PARAMETER: the stand-in only saves Data")
+        data = {"PolySizes": mesh["PolySizes"], "PolyUVWIDs": mesh["PolyUVWIDs"],
+                "CoordsUVW": mesh["UVW"], "SelectedVertIDs": array.array("i")}
+        if parameters.get(HANDLE_KEY):
+            # the reply is written in a segment the client reads then unlinks
+            return {HANDLE_KEY: WriteSegment({"Data." + k: v for k, v in data.items()})}
+        return {"Data": data}
+
+    def CommandBatch(self, parameters : dict):
+        """ Run commands in order, stopping at the first failure. """
+        results = []
+        for commandName, commandParameters in parameters.get("Commands", []):
+            if commandName == "Batch":
+                return {"Results": results, "Failed": len(results), "Error": "Batches do not nest"}
+            try:
+                results.append(_Native(self.Dispatch(commandName, commandParameters)))
+            except Exception as ex:
+                return {"Results": results, "Failed": len(results), "Error": str(ex)}
+        return {"Results": results, "Failed": -1}
+
+    def CommandQuit(self, parameters):
+        return None
+
+    def CommandExit(self, parameters):
+        return None
+
+
+class CRizomUVStandInPyd:
+    """ Client side of the stand-in, with the methods of the compiled
+        RizomUVLinkPyd object a CRizomUVLinkBase uses. """
+
+    def __init__(self, authKey : bytes = AUTH_KEY, heartBeatTimeOut : float = None):
+        self.authKey = authKey
+        # ms without a heart beat nor a reply after which the instance is deemed
+        # lost, before the command timeout. None: only the timeout applies.
+        self.heartBeatTimeOut = heartBeatTimeOut
+        self.address = None
+        self.conn = None
+        self.notifyAddress = None
+        self.notifyConn = None
+
+    def VersionString(self) -> str:
+        return STANDIN_VERSION
+
+    def Connect(self, address : str):
+        """ address is "tcp://127.0.0.1:<port>", as for the compiled module """
+        host, port = address.rsplit("/", 1)[-1].rsplit(":", 1)
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        self.address = (host, int(port))
+
+    def TCPPortIsOpen(self, port : int) -> bool:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            return s.connect_ex(("127.0.0.1", port)) == 0
+
+    def Execute(self, commandName : str, parameters, timeOut : int):
+        if self.address is None:
+            raise CZEx("Not connected")
+        if self.conn is None:
+            try:
+                self.conn = _Client(self.address, self.authKey, timeOut / 1000.0)
+            except (OSError, EOFError) as ex:
+                raise CZEx("Cannot connect to " + str(self.address) + ": " + str(ex))
+            except AuthenticationError as ex:
+                raise CZEx("Cannot connect to " + str(self.address) + ", authentication failed: " + str(ex))
+            _NoDelay(self.conn)
+        try:
+            self.conn.send((commandName, parameters))
+            deadline = time.monotonic() + timeOut / 1000.0
+            while True:
+                remaining = deadline - time.monotonic()
+                wait = remaining if self.heartBeatTimeOut is None else min(remaining, self.heartBeatTimeOut / 1000.0)
+                if not self.conn.poll(max(0.0, wait)):
+                    if wait < remaining:
+                        raise CZEx("Connection lost: no heart beat from the instance for "
+                                   + str(self.heartBeatTimeOut) + " ms during " + commandName)
+                    raise CZEx(commandName + " timed out after " + str(timeOut) + " ms")
+                kind, value = self.conn.recv()
+                if kind != "HeartBeat":
+                    break
+        except (CZEx, OSError, EOFError) as ex:
+            # the exchange is out of step now: start over on a fresh connection
+            self.conn.close()
+            self.conn = None
+            if isinstance(ex, CZEx):
+                raise
+            raise CZEx("Connection lost: " + str(ex))
+        if kind == "Error":
+            raise CZEx(value)
+        return value
+
+    def NotifyConnect(self, port : int):
+        if self.notifyConn is not None:
+            self.notifyConn.close()
+            self.notifyConn = None
+        self.notifyAddress = ("127.0.0.1", int(port))
+
+    def NotifyPoll(self, timeout_ms = 0):
+        """ [path, version], or [] when nothing came within timeout_ms. """
+        if self.notifyConn is None:
+            try:
+                self.notifyConn = _Client(self.notifyAddress, self.authKey, max(timeout_ms, 200) / 1000.0)
+            except (OSError, EOFError, TypeError, AuthenticationError, CZEx):
+                # nothing listening (yet): like a SUB socket, wait and see nothing
+                time.sleep(timeout_ms / 1000.0)
+                return []
+        try:
+            if not self.notifyConn.poll(timeout_ms / 1000.0):
+                return []
+            return self.notifyConn.recv()
+        except (OSError, EOFError):
+            self.notifyConn.close()
+            self.notifyConn = None
+            return []
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description = "Pure Python stand-in for a RizomUV instance")
+    parser.add_argument("--port", "-id", type = int, required = True)
+    parser.add_argument("-bg", action = "store_true", help = "RizomUV's, for RunRizomUV: the stand-in has no window anyway")
+    parser.add_argument("--latency", type = float, default = 0.0, help = "ms added to every reply")
+    parser.add_argument("--jitter", type = float, default = 0.0, help = "random ms, up to that much, added on top")
+    parser.add_argument("--heartbeat", type = float, default = 500.0, help = "heart beat period in ms while a command runs, 0 for none")
+    args = parser.parse_args()
+    CRizomUVStandIn(args.port, latencyMs = args.latency, jitterMs = args.jitter, heartBeatMs = args.heartbeat).Serve()
@@ -0,0 +1,279 @@
+# MIT License
+#
+# Copyright (c) 2026 Rizom-Lab
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+#
+# Transfer throughput and latency benchmark
+# -----------------------------------------
+#
+# Measures, for quad grid meshes of increasing size:
+#
+#   Load/Data    Load() of the Data.* vectors
+#   Load/File    Load() of the same mesh written to an .obj file
+#   Save/Data    Save({"Data": True})
+#   Get          Get("Lib.Mesh.UVW"), the whole UVW vector
+#   GetVersion   recursive GetVersion of Lib.Mesh, which transfers no data
+#   Set          one small Set(), a pure round trip
+#
+# and reports, per command and mesh size, the p50 and p99 latencies and the
+# payload throughput in MB/s. Payload sizes are the estimates of the link
+# metrics (8 bytes per vector element, see PayloadBytes), so that figures of
+# different releases and machines compare.
+#
+# Against the pure Python stand-in (the default, runs anywhere):
+#
+#     python benchmarks/TransferBenchmark.py
+#
+# against a RizomUV instance launched for the run, or one already running:
+#
+#     python benchmarks/TransferBenchmark.py --launch [path/to/rizomuv]
+#     python benchmarks/TransferBenchmark.py --port 50000
+#
+# --json writes the results for later runs to be compared with through
+# --baseline, which flags every p50 slower than the baseline's by more than
+# --tolerance percent. The default sizes go up to 10M polygons, several GB of
+# client memory: use --sizes to stay below on smaller machines. A command the
+# target does not implement (the stand-in has no file Load) is reported as
+# such and skipped.
+#
+# # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from os.path import abspath
+from os.path import dirname
+
+sys.path.insert(0, dirname(dirname(abspath(__file__))))
+
+from RizomUVLink import CRizomUVLink
+from RizomUVLink import CZEx
+from RizomUVLinkMetrics import PayloadBytes
+
+DEFAULT_SIZES = (1000, 10000, 100000, 1000000, 10000000)
+
+
+def GridMesh(polygons : int) -> dict:
+    """ Load() parameters of a flat grid of polygons quads, as NumPy arrays when
+        NumPy is available. """
+    cols = int(math.ceil(math.sqrt(polygons)))
+    rows = -(-polygons // cols)
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+
+    if numpy is not None:
+        first = numpy.arange(polygons, dtype = numpy.int64)
+        first = first // cols * (cols + 1) + first % cols
+        ids = numpy.stack([first, first + 1, first + cols + 2, first + cols + 1], axis = 1)
+        y, x = numpy.divmod(numpy.arange((rows + 1) * (cols + 1), dtype = numpy.float64), cols + 1)
+        xyz = numpy.stack([x, y, numpy.zeros_like(x)], axis = 1) / cols
+        return {"Data.PolySizes": numpy.full(polygons, 4, dtype = numpy.int32),
+                "Data.PolyXYZIDs": ids.astype(numpy.int32).reshape(-1),
+                "Data.CoordsXYZ": xyz.reshape(-1)}
+
+    import array
+    ids = array.array("i")
+    for p in range(polygons):
+        first = p // cols * (cols + 1) + p % cols
+        ids.extend((first, first + 1, first + cols + 2, first + cols + 1))
+    xyz = array.array("d")
+    for v in range((rows + 1) * (cols + 1)):
+        xyz.extend((v % (cols + 1) / cols, v // (cols + 1) / cols, 0.0))
+    return {"Data.PolySizes": array.array("i", [4]) * polygons, "Data.PolyXYZIDs": ids, "Data.CoordsXYZ": xyz}
+
+
+def WriteObj(mesh : dict, path : str):
+    xyz = mesh["Data.CoordsXYZ"]
+    ids = mesh["Data.PolyXYZIDs"]
+    with open(path, "w") as f:
+        for i in range(0, len(xyz), 3):
+            f.write("v %r %r %r\n" % (float(xyz[i]), float(xyz[i + 1]), float(xyz[i + 2])))
+        for i in range(0, len(ids), 4):
+            f.write("f %d %d %d %d\n" % (ids[i] + 1, ids[i + 1] + 1, ids[i + 2] + 1, ids[i + 3] + 1))
+
+
+def Percentile(samples : list, ratio : float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(math.ceil(ratio * len(ordered))) - 1)]
+
+
+def Measure(command, repeats : int) -> tuple:
+    """ (latencies in ms, payload bytes) of repeats calls of command(), which
+        returns the payload size of its call, after one warm-up call. """
+    command()
+    latencies = []
+    size = 0
+    for i in range(repeats):
+        start = time.perf_counter()
+        size = command()
+        latencies.append((time.perf_counter() - start) * 1000.0)
+    return latencies, size
+
+
+def Benchmarks(link : CRizomUVLink, mesh : dict, objPath : str) -> list:
+    """ [(name, command)], each command returning its payload size. """
+    meshBytes = 8 * sum(len(vector) for vector in mesh.values())
+
+    def loadData():
+        link.Load(mesh)
+        return meshBytes
+
+    def loadFile():
+        link.Load({"File.Path": objPath})
+        return os.path.getsize(objPath)
+
+    def saveData():
+        return PayloadBytes(link.Save({"Data": True}))
+
+    def get():
+        return PayloadBytes(link.Get("Lib.Mesh.UVW"))
+
+    def getVersion():
+        link.GetVersion({"Path": "Lib.Mesh", "Recursive": True})
+        return 0
+
+    def set():
+        link.Set({"Path": "Vars.WindowManager.Visibility.Log", "Value": False})
+        return 0
+
+    # Load/Data after Load/File: the reads work on the mesh it loads
+    return [("Load/File", loadFile), ("Load/Data", loadData), ("Save/Data", saveData),
+            ("Get", get), ("GetVersion", getVersion), ("Set", set)]
+
+
+def Run(link : CRizomUVLink, sizes : list, repeats : int, log = print) -> list:
+    results = []
+    directory = tempfile.mkdtemp(prefix = "rizomuvlink-bench-")
+    try:
+        for polygons in sizes:
+            mesh = GridMesh(polygons)
+            objPath = os.path.join(directory, "grid.obj")
+            WriteObj(mesh, objPath)
+            # the big commands are too long for the default timeouts
+            with link.timeOutPolicy.Override(link.timeOutPolicy.maximum):
+                for name, command in Benchmarks(link, mesh, objPath):
+                    row = {"command": name, "polygons": polygons}
+                    try:
+                        latencies, size = Measure(command, repeats)
+                    except CZEx as ex:
+                        row["error"] = str(ex)
+                        log("%-11s %10d  not available: %s" % (name, polygons, ex))
+                        results.append(row)
+                        continue
+                    p50 = Percentile(latencies, 0.50)
+                    row.update({"bytes": size, "p50Ms": p50, "p99Ms": Percentile(latencies, 0.99),
+                                "MBps": size / 1e6 / (p50 / 1000.0) if size and p50 > 0 else None})
+                    results.append(row)
+                    log("%-11s %10d  %10.1f MB  p50 %10.3f ms  p99 %10.3f ms  %s" % (
+                        name, polygons, size / 1e6, row["p50Ms"], row["p99Ms"],
+                        "" if row["MBps"] is None else "%.1f MB/s" % row["MBps"]))
+            os.remove(objPath)
+    finally:
+        os.rmdir(directory)
+    return results
+
+
+def Compare(results : list, baseline : list, tolerance : float, log = print) -> int:
+    """ Log the p50s slower than the baseline's by more than tolerance percent,
+        and return how many there are. """
+    reference = {(r["command"], r["polygons"]): r for r in baseline if "p50Ms" in r}
+    regressions = 0
+    for row in results:
+        before = reference.get((row["command"], row["polygons"]))
+        if before is None or "p50Ms" not in row:
+            continue
+        change = 100.0 * (row["p50Ms"] / before["p50Ms"] - 1.0)
+        if change > tolerance:
+            regressions += 1
+            log("REGRESSION %-11s %10d  p50 %.3f ms -> %.3f ms (%+.0f%%)" % (
+                row["command"], row["polygons"], before["p50Ms"], row["p50Ms"], change))
+    return regressions
+
+
+def StartStandIn() -> tuple:
+    """ (link, process) of a stand-in server in a process of its own, so that it
+        does not share the interpreter lock with the client being measured. The
+        link runs on the stand-in's backend: no compiled module is needed. """
+    from RizomUVLinkStandIn import CRizomUVStandInPyd
+    link = CRizomUVLink(rizomuv = CRizomUVStandInPyd())
+    port, lock = link.FreeTCPPort()
+    try:
+        process = subprocess.Popen([sys.executable, os.path.join(dirname(dirname(abspath(__file__))), "RizomUVLinkStandIn.py"),
+                                    "--port", str(port)])
+        link.WaitForPort(port, 30.0, process = process)
+    finally:
+        lock.Release()
+    link.Connect(port)
+    return link, process
+
+
+def Main():
+    parser = argparse.ArgumentParser(description = "RizomUVLink transfer throughput and latency benchmark")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--port", type = int, help = "benchmark the instance already listening on that port")
+    target.add_argument("--launch", nargs = "?", const = "", metavar = "EXE", help = "launch a RizomUV instance for the run")
+    parser.add_argument("--sizes", default = ",".join(str(s) for s in DEFAULT_SIZES), help = "polygon counts, comma separated")
+    parser.add_argument("--repeats", type = int, default = 5)
+    parser.add_argument("--json", help = "write the results to that file")
+    parser.add_argument("--baseline", help = "results of a previous run to compare with")
+    parser.add_argument("--tolerance", type = float, default = 10.0, help = "p50 slowdown, in percent, reported as a regression")
+    args = parser.parse_args()
+
+    standIn = None
+    if args.port is not None:
+        link = CRizomUVLink()
+        link.Connect(args.port)
+    elif args.launch is not None:
+        link = CRizomUVLink()
+        link.RunRizomUV(args.launch or None)
+    else:
+        link, standIn = StartStandIn()
+
+    try:
+        version = str(link.Get("Vars.Infos.Version.Full"))
+        print("Target: " + version)
+        results = Run(link, [int(s) for s in args.sizes.split(",")], args.repeats)
+    finally:
+        if args.launch is not None or standIn is not None:
+            link.Quit({})
+        if standIn is not None:
+            standIn.wait(timeout = 10.0)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"version": version, "results": results}, f, indent = 1)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = Compare(results, json.load(f)["results"], args.tolerance)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    Main()
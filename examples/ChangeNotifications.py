@@ -49,8 +49,9 @@
 #     each callback, pull what you actually need with Get()/Save().
 #   * No false positives at rest: a path fires only when its value really changed.
 #   * A long operation (e.g. Pack) may fire several notifications, each carrying
-#     a real intermediate version. Debounce on your side if you want one event
-#     per operation.
+#     a real intermediate version. Pass quietMs (and optionally maxLatencyMs)
+#     to StartNotificationListener if you want one event per operation: the
+#     notifications of a path are then merged until it stays quiet.
 #   * PUB/SUB can drop the very first messages before the subscription is fully
 #     established: do one full sync right after subscribing, then rely on the
 #     notifications.